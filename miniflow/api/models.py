@@ -100,6 +100,7 @@ class WorkflowGetResponse(BaseResponse):
 # 7. Workflow Listeleme - Giden/Response
 class WorkflowListResponse(BaseResponse):
     workflows: List[WorkflowGetResponse] = Field(..., description="Workflow listesi")
+    next_cursor: Optional[str] = Field(None, description="Sonraki sayfa için after_id olarak gönderilecek opak cursor (son sayfada null)")
 
 # EXECUTION MODELLERI
 # ==============================================================
@@ -128,4 +129,5 @@ class ExecutionGetResponse(BaseResponse):
     ended_at: Optional[str] = Field(...) 
 
 class ExecutionListResponse(BaseResponse):
-    executions: List[ExecutionGetResponse] = Field(...)
\ No newline at end of file
+    executions: List[ExecutionGetResponse] = Field(...)
+    next_cursor: Optional[str] = Field(None, description="Sonraki sayfa için after_id olarak gönderilecek opak cursor (son sayfada null)")
@@ -1,8 +1,11 @@
 from fastapi import APIRouter, status, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 import logging
+import json
 import os
 
+from ...utils import encode_page_cursor
 from ..models import (
     ExecutionCreateResponse, ExecutionGetResponse, ExecutionCancelResponse,
     ExecutionListResponse
@@ -44,9 +47,10 @@ async def execution_cancel(execution_id: str, core = Depends(get_miniflow_core))
     )
 
 @router.get("/list", response_model=ExecutionListResponse, status_code=status.HTTP_200_OK)
-async def execution_list(core = Depends(get_miniflow_core)):
-    """List all executions"""
-    result = core.execution_list()
+async def execution_list(page_size: int = Query(100, ge=1, le=1000), after_id: Optional[str] = None,
+                         core = Depends(get_miniflow_core)):
+    """List executions (newest first, keyset paginated via after_id)"""
+    result = core.execution_list(page_size=page_size, after_id=after_id)
 
     executions = []
     for execution in result:
@@ -61,7 +65,15 @@ async def execution_list(core = Depends(get_miniflow_core)):
             ended_at=execution.get('ended_at')  # Handle optional field
         ))
 
-    return ExecutionListResponse(executions=executions)
+    # Cursor son satırın (created_at, id) değerini taşır: anchor satır silinse de sonraki sayfa doğru başlar
+    next_cursor = encode_page_cursor(result[-1]['created_at'], result[-1]['id']) if len(result) == page_size else None
+    return ExecutionListResponse(executions=executions, next_cursor=next_cursor)
+
+@router.get("/stream", status_code=status.HTTP_200_OK)
+async def execution_list_stream(core = Depends(get_miniflow_core)):
+    """Stream all executions as NDJSON (one execution per line)"""
+    executions = core.execution_list_stream()
+    return StreamingResponse((json.dumps(execution) + "\n" for execution in executions), media_type="application/x-ndjson")
 
 @router.get("/{execution_id}", response_model=ExecutionGetResponse, status_code=status.HTTP_200_OK)
 async def execution_get(execution_id: str, core = Depends(get_miniflow_core)):
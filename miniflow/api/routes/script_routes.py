@@ -1,6 +1,8 @@
 from fastapi import APIRouter, status, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 import logging
+import json
 import os
 
 from ..models import (
@@ -47,7 +49,7 @@ async def script_create(request: ScriptCreateRequest, core = Depends(get_miniflo
 @router.get("/list", response_model=ScriptListResponse)
 async def script_list(core = Depends(get_miniflow_core)):
     """List all scripts"""
-    scripts = core.script_list()
+    scripts = await core.script_list_async()
     
     script_responses = []
     for script in scripts:
@@ -66,10 +68,16 @@ async def script_list(core = Depends(get_miniflow_core)):
     
     return ScriptListResponse(scripts=script_responses)
 
+@router.get("/stream")
+async def script_list_stream(core = Depends(get_miniflow_core)):
+    """Stream all scripts as NDJSON (one script per line)"""
+    scripts = core.script_list_stream()
+    return StreamingResponse((json.dumps(script) + "\n" for script in scripts), media_type="application/x-ndjson")
+
 @router.get("/{script_id}", response_model=ScriptGetResponse)
 async def script_get(script_id: str, include_content: bool = Query(False, description="Include script file content in response"), core = Depends(get_miniflow_core)):
     """Get script details"""
-    result = core.script_get(script_id, include_content)
+    result = await core.script_get_async(script_id, include_content)
     
     return ScriptGetResponse(
         script_id=result['id'],  # Fixed: was missing script_id field
@@ -1,7 +1,10 @@
 from fastapi import APIRouter, status, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 import logging
+import json
 
+from ...utils import encode_page_cursor
 from ..models import (
     WorkflowCreateRequest, WorkflowCreateResponse,
     WorkflowDeleteResponse,
@@ -37,10 +40,11 @@ async def workflow_create(workflow_data: WorkflowCreateRequest, miniflow_core=De
     )
 
 @router.get("/list", response_model=WorkflowListResponse)
-async def workflow_list(miniflow_core=Depends(get_miniflow_core)):
-    """List all workflows"""
+async def workflow_list(page_size: int = Query(100, ge=1, le=1000), after_id: Optional[str] = None,
+                        miniflow_core=Depends(get_miniflow_core)):
+    """List workflows (newest first, keyset paginated via after_id)"""
     # Call core method (Exception handling centralized)
-    workflows = miniflow_core.workflow_list()
+    workflows = await miniflow_core.workflow_list_async(page_size=page_size, after_id=after_id)
     
     # Map response to WorkflowGetResponse format for each workflow
     workflow_responses = []
@@ -58,13 +62,21 @@ async def workflow_list(miniflow_core=Depends(get_miniflow_core)):
             triggers=wf.get("triggers", [])
         ))
     
-    return WorkflowListResponse(workflows=workflow_responses)
+    # Cursor son satırın (created_at, id) değerini taşır: anchor satır silinse de sonraki sayfa doğru başlar
+    next_cursor = encode_page_cursor(workflows[-1]["created_at"], workflows[-1]["id"]) if len(workflows) == page_size else None
+    return WorkflowListResponse(workflows=workflow_responses, next_cursor=next_cursor)
+
+@router.get("/stream")
+async def workflow_list_stream(miniflow_core=Depends(get_miniflow_core)):
+    """Stream all workflows as NDJSON (one workflow per line)"""
+    workflows = miniflow_core.workflow_list_stream()
+    return StreamingResponse((json.dumps(wf) + "\n" for wf in workflows), media_type="application/x-ndjson")
 
 @router.get("/{workflow_id}", response_model=WorkflowGetResponse)
 async def workflow_get(workflow_id: str, miniflow_core=Depends(get_miniflow_core)):
     """Get workflow details with nodes, edges, and triggers"""
     # Call core method (Exception handling centralized)
-    workflow = miniflow_core.workflow_get(workflow_id)
+    workflow = await miniflow_core.workflow_get_async(workflow_id)
     
     # Map response
     return WorkflowGetResponse(
@@ -60,6 +60,8 @@ DOSYA YAPISI:
 ============
 ├── config.py      - Database konfigrasyon sınıfları
 ├── engine.py      - Database engine ve session yönetimi
+├── async_engine.py - AsyncEngine / AsyncSession (asenkron okuma yolu; greenlet gerektirir,
+│                     paket import'unda yüklenmez: `from .database_manager.async_engine import ...`)
 ├── models.py      - SQLAlchemy ORM modelleri
 ├── orchestration.py - Yüksek seviye iş akışı operasyonları
 └── crud/          - Temel CRUD operasyonları
@@ -100,6 +102,8 @@ from .engine import create_database_engine                     # Engine factory
 # SQLAlchemy tabloları ve model tanımları
 # =============================================================================
 from .models import Base                                        # SQLAlchemy declarative base
+from .models import SCHEMA_VERSION                              # Beklenen şema versiyonu
+from .models import INDEXES                                     # Performans index DDL'leri
 
 # =============================================================================
 # ORCHESTRATION COMPONENTS
@@ -126,6 +130,8 @@ __all__ = [
     
     # Model exports
     "Base",
+    "SCHEMA_VERSION",
+    "INDEXES",
     
     # Orchestration exports
     "DatabaseOrchestration"
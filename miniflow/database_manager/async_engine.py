@@ -0,0 +1,188 @@
+"""
+ASYNC DATABASE ENGINE MODULE
+============================
+
+Bu modül DatabaseEngine'in asyncio karşılığını sağlar. SQLAlchemy AsyncEngine
+ve AsyncSession kullanarak okuma ağırlıklı API çağrılarının event loop'u
+bloklamadan çalışmasını sağlar.
+
+Orchestration katmanı senkron yazıldığı için sorgular AsyncSession.run_sync()
+ile çalıştırılır; böylece aynı orchestration metotları hem senkron hem de
+asenkron yolda kullanılır.
+
+ASYNC DRIVER'LAR:
+================
+• SQLite: aiosqlite
+• MySQL: aiomysql
+• PostgreSQL: asyncpg
+
+USAGE EXAMPLE:
+=============
+```python
+async_engine = AsyncDatabaseEngine(config)
+async_engine.start()
+
+workflows = await async_engine.run_read(orchestration.get_workflows, None, 100, None)
+
+await async_engine.dispose()
+```
+"""
+
+from contextlib import asynccontextmanager
+from typing import Optional, Callable, Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from .config import DatabaseConfig, DatabaseType
+
+
+class AsyncDatabaseEngine:
+    """
+    SQLAlchemy AsyncEngine ve AsyncSession management için sınıf
+
+    INSTANCE ATTRIBUTES:
+    ===================
+    • __config: DatabaseConfig instance (private)
+    • __engine: SQLAlchemy AsyncEngine instance (private)
+    • __session_factory: async_sessionmaker instance (private)
+    • is_alive: Engine durumu (public readonly)
+
+    METHODS:
+    ========
+    • start(): AsyncEngine ve session factory oluşturma
+    • stop(): Senkron cleanup (connection'lar kapatılmadan pool bırakılır)
+    • dispose(): Asenkron cleanup
+    • get_session_context(): Commit/rollback yöneten async context manager
+    • get_read_session_context(): Hiç commit etmeyen async context manager
+    • run_read(): Senkron bir sorgu fonksiyonunu read session'da çalıştırma
+    """
+
+    # DatabaseType -> async driver'lı SQLAlchemy URL prefix'i
+    ASYNC_DRIVERS = {
+        DatabaseType.SQLITE: "sqlite+aiosqlite",
+        DatabaseType.MYSQL: "mysql+aiomysql",
+        DatabaseType.POSTGRESQL: "postgresql+asyncpg",
+    }
+
+    def __init__(self, config: DatabaseConfig) -> None:
+        """
+        AsyncDatabaseEngine instance oluşturur
+
+        Args:
+            config (DatabaseConfig): Database konfigrasyon objesi
+        """
+        self.__config: DatabaseConfig = config
+        self.__engine: Optional[AsyncEngine] = None
+        self.__session_factory: Optional[async_sessionmaker] = None
+        self.is_alive: bool = False
+
+    def start(self) -> None:
+        """
+        AsyncEngine ve session factory oluşturur
+
+        Connection açılmaz; driver import edilemiyorsa ImportError fırlatılır.
+        """
+        print("[ASYNC DB ENGINE] - Starting async database engine")
+        self.__engine = create_async_engine(self.__async_connection_string(), **self.__async_engine_config())
+        self.__session_factory = async_sessionmaker(
+            bind=self.__engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False
+        )
+        self.is_alive = True
+        print("[ASYNC DB ENGINE] - Async database engine started successfully")
+
+    def stop(self) -> None:
+        """
+        Senkron shutdown yolu (event loop dışından çağrılabilir)
+
+        Connection'lar kapatılmadan pool bırakılır; event loop içindeysen dispose() kullan.
+        """
+        if self.__engine:
+            self.__engine.sync_engine.dispose(close=False)
+        self.__engine = None
+        self.__session_factory = None
+        self.is_alive = False
+        print("[ASYNC DB ENGINE] - Async database engine stopped")
+
+    async def dispose(self) -> None:
+        """Connection'ları kapatarak engine'i durdurur"""
+        if self.__engine:
+            await self.__engine.dispose()
+        self.__engine = None
+        self.__session_factory = None
+        self.is_alive = False
+
+    @asynccontextmanager
+    async def get_session_context(self):
+        """
+        Async session lifecycle management
+
+        - Başarı durumunda: commit
+        - Hata durumunda: rollback
+        - Her durumda: close
+        """
+        if not self.__session_factory:
+            raise RuntimeError("Async engine not initialized. Call start() method first.")
+
+        session = self.__session_factory()
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    @asynccontextmanager
+    async def get_read_session_context(self):
+        """Sadece okuma yapan async session; hiçbir zaman commit edilmez"""
+        if not self.__session_factory:
+            raise RuntimeError("Async engine not initialized. Call start() method first.")
+
+        session = self.__session_factory()
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
+
+    async def run_read(self, query: Callable[..., Any], *args) -> Any:
+        """
+        Senkron sorgu fonksiyonunu read session içinde çalıştırır
+
+        Args:
+            query (Callable): İlk argümanı senkron Session olan fonksiyon
+            *args: query'ye geçirilecek diğer argümanlar
+
+        Returns:
+            Any: query'nin döndürdüğü değer
+        """
+        async with self.get_read_session_context() as session:
+            return await session.run_sync(query, *args)
+
+    def __async_connection_string(self) -> str:
+        # Senkron URL'nin driver prefix'ini async driver ile değiştir
+        sync_url = self.__config.get_connection_string()
+        _, rest = sync_url.split("://", 1)
+        return f"{self.ASYNC_DRIVERS[self.__config.db_type]}://{rest}"
+
+    def __async_engine_config(self) -> dict:
+        engine_config = self.__config.engine_config.to_dict()
+
+        # QueuePool async engine ile kullanılamaz (AsyncAdaptedQueuePool varsayılandır)
+        engine_config.pop('poolclass', None)
+
+        # psycopg2 connect_args'ları asyncpg karşılıklarına çevir
+        if self.__config.db_type == DatabaseType.POSTGRESQL:
+            connect_args = dict(engine_config.get('connect_args') or {})
+            async_connect_args = {}
+            if 'connect_timeout' in connect_args:
+                async_connect_args['timeout'] = connect_args['connect_timeout']
+            if 'application_name' in connect_args:
+                async_connect_args['server_settings'] = {'application_name': connect_args['application_name']}
+            engine_config['connect_args'] = async_connect_args
+
+        return engine_config
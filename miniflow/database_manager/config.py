@@ -53,10 +53,12 @@ config = get_mysql_config(
 ```
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Optional, Dict, Any
 from enum import Enum
 
+from sqlalchemy.pool import QueuePool
+
 # =============================================================================
 # DATABASE TYPE DEFINITIONS
 # Desteklenen veritabanı türlerinin enum tanımları
@@ -94,6 +96,7 @@ class EngineConfig:
     - pool_timeout: Connection beklemek için maksimum süre (saniye)
     - pool_recycle: Connection'ın yenilenmesi için süre (saniye, -1 = disable)
     - pool_pre_ping: Connection'ların sağlık kontrolü
+    - poolclass: Pool implementasyonu (None = dialect varsayılanı)
     
     DEBUG PARAMETERS:
     - echo: SQL query'lerinin loglanması
@@ -113,6 +116,7 @@ class EngineConfig:
     pool_timeout: int = 30                 # Connection almak için maksimum bekleme süresi
     pool_recycle: int = 3600              # Connection yenileme süresi (1 saat)
     pool_pre_ping: bool = True            # Connection sağlık kontrolü aktif
+    poolclass: Optional[type] = None      # Pool sınıfı (None -> dialect varsayılanı)
 
     # Debug and Logging Settings
     echo: bool = False                    # SQL query logging (production'da False)
@@ -133,7 +137,7 @@ class EngineConfig:
         Returns:
             Dict[str, Any]: SQLAlchemy engine parametreleri
         """
-        return {
+        engine_kwargs = {
             'pool_size': self.pool_size,
             'max_overflow': self.max_overflow, 
             'pool_timeout': self.pool_timeout,
@@ -144,6 +148,9 @@ class EngineConfig:
             'echo_pool': self.echo_pool,
             'isolation_level': self.isolation_level,
         }
+        if self.poolclass is not None:
+            engine_kwargs['poolclass'] = self.poolclass
+        return engine_kwargs
 
 # =============================================================================
 # DATABASE CONFIGURATION CLASS
@@ -166,6 +173,7 @@ class DatabaseConfig:
     - port: Server portu (SQLite için None)  
     - username: Kullanıcı adı (SQLite için None)
     - password: Şifre (SQLite için None)
+    - read_url: Read replica connection string (opsiyonel, yoksa ana database kullanılır)
     
     ENGINE CONFIG:
     - engine_config: SQLAlchemy engine ayarları (EngineConfig instance)
@@ -180,6 +188,7 @@ class DatabaseConfig:
     port: Optional[int] = None                            # Server port number  
     username: Optional[str] = None                        # Database username
     password: Optional[str] = None                        # Database password
+    read_url: Optional[str] = None                        # Read replica URL (opsiyonel)
     
     # Engine Configuration
     engine_config: EngineConfig = field(default_factory=EngineConfig)  # SQLAlchemy engine config
@@ -242,6 +251,7 @@ DB_ENGINE_CONFIGS = {
         pool_timeout=60,                                 # Network gecikmesi için uzun timeout
         pool_recycle=3600,                              # 1 saatte bir connection yenile
         pool_pre_ping=True,                             # Network bağlantı kontrolü
+        poolclass=QueuePool,                            # Explicit QueuePool (concurrent session'lar)
         connect_args={                                  # PostgreSQL-specific ayarlar
             'connect_timeout': 30,                      # Initial connection timeout
             'application_name': 'miniflow_app'          # Connection identification
@@ -256,6 +266,7 @@ DB_ENGINE_CONFIGS = {
         pool_timeout=45,                                # Orta seviye timeout
         pool_recycle=7200,                             # 2 saatte bir connection yenile
         pool_pre_ping=True,                            # MySQL server durumu kontrolü
+        poolclass=QueuePool,                           # Explicit QueuePool (concurrent session'lar)
         connect_args={                                 # MySQL-specific ayarlar
             'connect_timeout': 30,                     # Connection establishment timeout
             'charset': 'utf8mb4',                      # Full UTF-8 support
@@ -270,6 +281,17 @@ DB_ENGINE_CONFIGS = {
 # Kolay ve tip-güvenli konfigrasyon oluşturma fonksiyonları
 # =============================================================================
 
+def _with_pool_overrides(db_type: DatabaseType, pool_overrides: Dict[str, Any]) -> Optional[EngineConfig]:
+    """
+    Predefined engine config'in pool alanlarını override eden bir kopya döndürür
+
+    None değerler yok sayılır; override yoksa None döner (predefined config kullanılır).
+    """
+    overrides = {key: value for key, value in pool_overrides.items() if value is not None}
+    if not overrides:
+        return None
+    return replace(DB_ENGINE_CONFIGS[db_type], **overrides)
+
 def get_sqlite_config(db_name: str = "miniflow_database") -> DatabaseConfig:
     """
     SQLite database için optimize edilmiş konfigrasyon oluşturur
@@ -293,7 +315,9 @@ def get_postgresql_config(
     host: str = "localhost", 
     port: int = 5432, 
     username: str = "postgres", 
-    password: str = "password"
+    password: str = "password",
+    read_url: Optional[str] = None,
+    **pool_overrides
 ) -> DatabaseConfig:
     """
     PostgreSQL database için optimize edilmiş konfigrasyon oluşturur
@@ -310,6 +334,8 @@ def get_postgresql_config(
         port (int): PostgreSQL server portu (varsayılan: 5432)
         username (str): Database kullanıcı adı
         password (str): Database şifresi
+        read_url (Optional[str]): Read replica connection string
+        **pool_overrides: EngineConfig pool alanları (pool_size, max_overflow, pool_timeout, pool_pre_ping, pool_recycle...)
         
     Returns:
         DatabaseConfig: PostgreSQL için optimize edilmiş konfigrasyon
@@ -320,7 +346,9 @@ def get_postgresql_config(
         host=host, 
         port=port,
         username=username, 
-        password=password
+        password=password,
+        custom_engine_config=_with_pool_overrides(DatabaseType.POSTGRESQL, pool_overrides),
+        read_url=read_url
     )
 
 def get_mysql_config(
@@ -328,7 +356,9 @@ def get_mysql_config(
     host: str = "localhost", 
     port: int = 3306,
     username: str = "root", 
-    password: str = "password"
+    password: str = "password",
+    read_url: Optional[str] = None,
+    **pool_overrides
 ) -> DatabaseConfig:
     """
     MySQL database için optimize edilmiş konfigrasyon oluşturur
@@ -345,6 +375,8 @@ def get_mysql_config(
         port (int): MySQL server portu (varsayılan: 3306)
         username (str): Database kullanıcı adı
         password (str): Database şifresi
+        read_url (Optional[str]): Read replica connection string
+        **pool_overrides: EngineConfig pool alanları (pool_size, max_overflow, pool_timeout, pool_pre_ping, pool_recycle...)
         
     Returns:
         DatabaseConfig: MySQL için optimize edilmiş konfigrasyon
@@ -355,7 +387,9 @@ def get_mysql_config(
         host=host, 
         port=port,
         username=username, 
-        password=password
+        password=password,
+        custom_engine_config=_with_pool_overrides(DatabaseType.MYSQL, pool_overrides),
+        read_url=read_url
     )
 
 def get_database_config(
@@ -365,7 +399,8 @@ def get_database_config(
     port: Optional[int] = None,  
     username: Optional[str] = None,  
     password: Optional[str] = None, 
-    custom_engine_config: Optional[EngineConfig] = None
+    custom_engine_config: Optional[EngineConfig] = None,
+    read_url: Optional[str] = None
 ) -> DatabaseConfig:
     """
     Generic database konfigrasyon oluşturucu fonksiyon
@@ -386,6 +421,7 @@ def get_database_config(
         username (Optional[str]): Kullanıcı adı (MySQL/PostgreSQL için gerekli)
         password (Optional[str]): Şifre (MySQL/PostgreSQL için gerekli)
         custom_engine_config (Optional[EngineConfig]): Özel engine konfigrasyonu
+        read_url (Optional[str]): Read replica connection string
         
     Returns:
         DatabaseConfig: Belirtilen parametrelerle oluşturulmuş konfigrasyon
@@ -415,6 +451,7 @@ def get_database_config(
         port=port,                         # Server portu (SQLite için None)  
         username=username,                 # Kullanıcı adı (SQLite için None)
         password=password,                 # Şifre (SQLite için None)
+        read_url=read_url,                 # Read replica (opsiyonel)
         engine_config=engine_config        # Engine konfigrasyonu
     )
         
\ No newline at end of file
@@ -21,6 +21,7 @@ class ArchivedExecutionCRUD(BaseCRUD[ArchivedExecution]):
     - update()
     - delete()
     - get_all()
+    - get_page_before()
     - count(), 
     - exists()
     - filter() 
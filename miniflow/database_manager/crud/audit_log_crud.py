@@ -21,6 +21,7 @@ class AuditLogCRUD(BaseCRUD[AuditLog]):
     - update()
     - delete()
     - get_all()
+    - get_page_before()
     - count(), 
     - exists()
     - filter() 
@@ -29,6 +29,7 @@ BASE CRUD ARCHITECTURE:
 ├─────────────────────────────────────────────────────────┤
 │  QUERY OPERATIONS:                                     │
 │  • get_all(session, skip, limit) → List[T]            │
+│  • get_page_before(session, before, limit) → List[T]   │
 │  • count(session) → int                               │
 │  • exists(session, id) → bool                         │
 │  • filter(session, filters, skip, limit) → List[T]   │
@@ -78,8 +79,8 @@ ERROR HANDLING PATTERNS:
 • Consistent error messages with context
 """
 
-from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
-from sqlalchemy import select, func, delete, update
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar, Union
+from sqlalchemy import select, func, delete, update, and_, or_
 from sqlalchemy.orm import DeclarativeMeta, Session
 
 # =============================================================================
@@ -358,7 +359,8 @@ class BaseCRUD(Generic[ModelType]):
     # Gelişmiş query ve filtering operasyonları
     # ==========================================================================
 
-    def get_all(self, session: Session, skip: int = 0, limit: int = 100) -> List[ModelType]:
+    def get_all(self, session: Session, skip: int = 0, limit: int = 100, options: Sequence[Any] = (),
+                order_by: Sequence[Any] = ()) -> List[ModelType]:
         """
         Pagination ile tüm record'ları retrieve eder
         
@@ -366,11 +368,41 @@ class BaseCRUD(Generic[ModelType]):
             session (Session): Database session
             skip (int): Skip edilecek record sayısı (offset)
             limit (int): Maksimum return edilecek record sayısı
+            options (Sequence[Any]): Loader option'ları (selectinload, raiseload vb.)
+            order_by (Sequence[Any]): Sıralama ifadeleri (OFFSET ile deterministik sayfalar için gerekli)
             
         Returns:
             List[ModelType]: Paginated record list
         """
-        stmt = select(self.model).offset(skip).limit(limit)
+        stmt = select(self.model).options(*options).order_by(*order_by).offset(skip).limit(limit)
+        return list(session.execute(stmt).scalars().all())
+
+    def get_page_before(self, session: Session, before: Optional[Tuple[Any, Union[str, int]]] = None, limit: int = 100,
+                        options: Sequence[Any] = ()) -> List[ModelType]:
+        """
+        Keyset pagination ile en yeni record'dan eskiye doğru retrieve eder
+
+        Sıralama (created_at DESC, id DESC). before verilirse sadece o
+        (created_at, id) değerinden sonra gelen record'lar okunur - OFFSET yok,
+        anchor record'un hâlâ var olması gerekmez.
+
+        Args:
+            session (Session): Database session
+            before (Optional[Tuple[Any, Union[str, int]]]): Önceki sayfanın son record'unun (created_at, id) değeri (None ise ilk sayfa)
+            limit (int): Maksimum return edilecek record sayısı
+            options (Sequence[Any]): Loader option'ları (selectinload, raiseload vb.)
+
+        Returns:
+            List[ModelType]: (created_at, id) DESC sıralı record list
+        """
+        stmt = select(self.model).options(*options)
+        if before is not None:
+            before_created_at, before_id = before
+            stmt = stmt.where(or_(
+                self.model.created_at < before_created_at,
+                and_(self.model.created_at == before_created_at, self.model.id < before_id)
+            ))
+        stmt = stmt.order_by(self.model.created_at.desc(), self.model.id.desc()).limit(limit)
         return list(session.execute(stmt).scalars().all())
 
     def count(self, session: Session) -> int:
@@ -20,6 +20,7 @@ class EdgeCRUD(BaseCRUD[Edge]):
     - update()
     - delete()
     - get_all()
+    - get_page_before()
     - count(), 
     - exists()
     - filter() 
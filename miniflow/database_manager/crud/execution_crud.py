@@ -22,6 +22,7 @@ class ExecutionCRUD(BaseCRUD[Execution]):
     - update()
     - delete()
     - get_all()
+    - get_page_before()
     - count(), 
     - exists()
     - filter() 
@@ -198,4 +199,17 @@ class ExecutionCRUD(BaseCRUD[Execution]):
             .where(self.model.workflow_id == workflow_id)
             .order_by(desc(self.model.created_at))
         )
-        return list(session.execute(stmt).scalars().all())
\ No newline at end of file
+        return list(session.execute(stmt).scalars().all())
+
+    def get_executions_by_workflow_projected(self, session: Session, workflow_id: str) -> List[Any]:
+        """Workflow'a ait execution'ları sadece liste kolonlarıyla getir (ORM object oluşturmadan)"""
+        stmt = (
+            select(
+                self.model.id, self.model.workflow_id, self.model.status,
+                self.model.started_at, self.model.ended_at,
+                self.model.created_at, self.model.updated_at
+            )
+            .where(self.model.workflow_id == workflow_id)
+            .order_by(desc(self.model.created_at))
+        )
+        return list(session.execute(stmt).all())
@@ -21,6 +21,7 @@ class ExecutionInputCRUD(BaseCRUD[ExecutionInput]):
     - update()
     - delete()
     - get_all()
+    - get_page_before()
     - count(), 
     - exists()
     - filter() 
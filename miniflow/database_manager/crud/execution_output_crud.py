@@ -22,6 +22,7 @@ class ExecutionOutputCRUD(BaseCRUD[ExecutionOutput]):
     - update()
     - delete()
     - get_all()
+    - get_page_before()
     - count(), 
     - exists()
     - filter() 
@@ -190,4 +191,50 @@ class ExecutionOutputCRUD(BaseCRUD[ExecutionOutput]):
         )
         
         result = session.execute(stmt).scalar_one_or_none()
-        return result or {}
\ No newline at end of file
+        return result or {}
+
+    def get_result_data_by_node_names(self, session: Session, execution_id: str,
+                                      node_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get result data for several nodes by name in a single IN query
+        Used for dynamic parameter resolution
+        Returns: {node_name: result_data} (only nodes with a successful output)
+        """
+        if not node_names:
+            return {}
+
+        stmt = (
+            select(Node.name, self.model.result_data)
+            .join(Node, self.model.node_id == Node.id)
+            .where(
+                and_(
+                    self.model.execution_id == execution_id,
+                    Node.name.in_(node_names),
+                    self.model.status == ExecutionOutputStatus.SUCCESS
+                )
+            )
+        )
+
+        return {row.name: row.result_data or {} for row in session.execute(stmt).all()}
+
+    def get_result_data_by_node_ids(self, session: Session, execution_id: str,
+                                    node_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get result data for several nodes by id in a single IN query (no Node join)
+        Returns: {node_id: result_data} (only nodes with a successful output)
+        """
+        if not node_ids:
+            return {}
+
+        stmt = (
+            select(self.model.node_id, self.model.result_data)
+            .where(
+                and_(
+                    self.model.execution_id == execution_id,
+                    self.model.node_id.in_(node_ids),
+                    self.model.status == ExecutionOutputStatus.SUCCESS
+                )
+            )
+        )
+
+        return {row.node_id: row.result_data or {} for row in session.execute(stmt).all()}
\ No newline at end of file
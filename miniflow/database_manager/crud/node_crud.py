@@ -20,6 +20,7 @@ class NodeCRUD(BaseCRUD[Node]):
     - update()
     - delete()
     - get_all()
+    - get_page_before()
     - count(), 
     - exists()
     - filter() 
@@ -21,6 +21,7 @@ class ScriptCRUD(BaseCRUD[Script]):
     - update()
     - delete()
     - get_all()
+    - get_page_before()
     - count(), 
     - exists()
     - filter() 
@@ -109,3 +110,10 @@ class ScriptCRUD(BaseCRUD[Script]):
         count = session.execute(stmt).scalar_one()
         return count > 0
 
+
+    def get_ids_by_names(self, session: Session, names: List[str]) -> Dict[str, str]:
+        """Script isimlerini tek sorguda ID'lere eşle - {name: id}"""
+        if not names:
+            return {}
+        stmt = select(self.model.name, self.model.id).where(self.model.name.in_(set(names)))
+        return {name: script_id for name, script_id in session.execute(stmt).all()}
@@ -22,6 +22,7 @@ class TriggerCRUD(BaseCRUD[Trigger]):
     - update()
     - delete()
     - get_all()
+    - get_page_before()
     - count(), 
     - exists()
     - filter() 
@@ -21,6 +21,7 @@ class WorkflowCRUD(BaseCRUD[Workflow]):
     - update()
     - delete()
     - get_all()
+    - get_page_before()
     - count(), 
     - exists()
     - filter() 
@@ -55,10 +55,11 @@ TRANSACTION ISOLATION:
 • PostgreSQL: READ_COMMITTED (enterprise safe)
 """
 
-from sqlalchemy import create_engine, Engine, text
+from sqlalchemy import create_engine, Engine, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from contextlib import contextmanager
+from datetime import datetime
 
 from .config import DatabaseConfig  
 
@@ -141,6 +142,8 @@ class DatabaseEngine:
     • __session_factory: SessionMaker instance (private)
     • __connection_string: Database URL string (private)
     • __engine_config: Engine configuration dict (private)
+    • __read_engine: Read replica engine instance (private, opsiyonel)
+    • __read_session_factory: Read-only session factory (private)
     • is_alive: Engine durumu (public readonly)
     
     LIFECYCLE METHODS:
@@ -153,12 +156,16 @@ class DatabaseEngine:
     ================
     • get_session: Manual session oluşturma
     • get_session_context(): Context manager ile otomatik session management
+    • get_read_session_context(): Read replica / read-only session management
     
     UTILITY METHODS:
     ================
     • create_tables(): Schema oluşturma
+    • ensure_tables(): Versiyon probe ile koşullu schema oluşturma
+    • warm_pool(): Connection pool'u önceden doldurma
     • drop_tables(): Schema silme
     • test_connection(): Bağlantı testi
+    • ping(): Hafif SELECT 1 bağlantı kontrolü
     • execute_raw_sql(): Direct SQL execution
     """
 
@@ -182,6 +189,8 @@ class DatabaseEngine:
         self.__config: DatabaseConfig = config                              # Database konfigrasyonu
         self.__engine: Optional[Engine] = None                             # SQLAlchemy engine (lazy init)
         self.__session_factory: Optional[sessionmaker] = None             # Session factory (lazy init)
+        self.__read_engine: Optional[Engine] = None                        # Read replica engine (opsiyonel)
+        self.__read_session_factory: Optional[sessionmaker] = None        # Read session factory (lazy init)
         
         # Step 2: Derived configuration
         self.__connection_string: str = config.get_connection_string()     # Database URL string
@@ -242,10 +251,14 @@ class DatabaseEngine:
         # Step 1: Engine dispose (connection pool cleanup)
         if self.__engine:
             self.__engine.dispose()
+        if self.__read_engine:
+            self.__read_engine.dispose()
         
         # Step 2: Instance references cleanup
         self.__engine = None
         self.__session_factory = None
+        self.__read_engine = None
+        self.__read_session_factory = None
         
         # Step 3: Engine state reset
         self.is_alive = False
@@ -263,6 +276,13 @@ class DatabaseEngine:
             **self.__engine_config        # Engine configuration (pooling, timeouts, etc.)
         )
 
+        # Read replica tanımlıysa ayrı engine (ayrı pool) oluştur
+        if self.__config.read_url:
+            self.__read_engine = create_engine(
+                self.__config.read_url,
+                **self.__engine_config
+            )
+
     def __create_session_factory(self) -> None:
         """
         SQLAlchemy SessionMaker factory oluşturur
@@ -278,6 +298,14 @@ class DatabaseEngine:
             expire_on_commit=self.__engine_config.get('expire_on_commit', True)  # Refresh objects after commit
         )
 
+        # Read session'lar: replica varsa ona, yoksa ana engine'e bind edilir.
+        # Okuma session'ları hiç flush/commit yapmaz.
+        self.__read_session_factory = sessionmaker(
+            bind=self.__read_engine or self.__engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+
     @property
     def get_engine(self) -> Engine:
         """
@@ -362,6 +390,37 @@ class DatabaseEngine:
         finally:
             # Step 5: Her durumda session cleanup
             session.close()
+
+    @contextmanager
+    def get_read_session_context(self):
+        """
+        Sadece okuma yapan işlemler için session context manager
+
+        Read replica tanımlıysa (DatabaseConfig.read_url) replica engine'i,
+        aksi takdirde ana engine'i kullanır. Session hiçbir zaman commit
+        edilmez; yazma yapan session'larla aynı transaction davranışını
+        paylaşmadığı için okuma gecikmesi yazma patlamalarından ayrışır.
+
+        ALGORITHM:
+        1. Engine durumunu kontrol et
+        2. Read session oluştur ve yield et
+        3. Her durumda rollback ve close
+
+        Yields:
+            Session: Okuma için kullanılacak session
+        """
+        # Step 1: Engine durumu kontrolü
+        if not self.__read_session_factory:
+            raise RuntimeError("Session factory not initialized. Call start() method first.")
+
+        # Step 2: Read session oluştur
+        session = self.__read_session_factory()
+        try:
+            yield session
+        finally:
+            # Step 3: Okuma transaction'ını kapat
+            session.rollback()
+            session.close()
     
     def create_tables(self, base_metadata) -> None:
         """
@@ -397,6 +456,111 @@ class DatabaseEngine:
             print(f"[DB ENGINE] - Table creation failed: {e}")
             raise
         
+    def ensure_tables(self, base_metadata, schema_version: int, meta_table: str = "miniflow_meta",
+                      extra_ddl: Optional[List[str]] = None) -> bool:
+        """
+        Şema güncel değilse tabloları oluşturur
+
+        create_all() her çağrıda tablo başına bir existence check sorgusu
+        çalıştırır. Bunun yerine tek bir meta tablo probe edilir; kayıtlı
+        versiyon beklenen versiyonla aynıysa tablo oluşturma tamamen atlanır.
+
+        ALGORITHM:
+        1. Engine durumunu kontrol et, gerekirse başlat
+        2. Meta tabloyu probe et ve kayıtlı versiyonu oku
+        3. Versiyon güncelse hiçbir şey yapma
+        4. Değilse create_tables() ve extra DDL'leri çalıştır, yeni versiyonu kaydet
+
+        Args:
+            base_metadata: SQLAlchemy MetaData instance (Base.metadata)
+            schema_version (int): Beklenen şema versiyonu
+            meta_table (str): Versiyon bilgisini tutan tablo adı
+            extra_ddl (Optional[List[str]]): Tablolardan sonra çalıştırılacak DDL'ler (örn. index'ler)
+
+        Returns:
+            bool: Tablolar oluşturulduysa True, şema zaten güncelse False
+        """
+        # Step 1: Engine durumu kontrolü
+        if not self.is_alive:
+            print("[DB ENGINE] - Engine not started, starting now")
+            self.start()
+
+        # Step 2: Tek probe ile mevcut versiyonu oku
+        with self.__engine.connect() as connection:
+            current_version = None
+            if inspect(connection).has_table(meta_table):
+                current_version = connection.execute(
+                    text(f"SELECT MAX(schema_version) FROM {meta_table}")
+                ).scalar()
+
+        # Step 3: Şema güncel ise atla
+        if current_version == schema_version:
+            print(f"[DB ENGINE] - Schema up to date (version {schema_version}), skipping table creation")
+            return False
+
+        # Step 4: Tabloları ve extra DDL'leri oluştur, versiyonu kaydet
+        self.create_tables(base_metadata)
+        for ddl in extra_ddl or []:
+            try:
+                with self.__engine.begin() as connection:
+                    connection.execute(text(ddl))
+            except Exception as e:
+                # Dialect desteklemiyorsa (örn. MySQL'de IF NOT EXISTS) startup'ı bozma
+                print(f"[DB ENGINE] - DDL skipped: {ddl} ({e})")
+        with self.__engine.begin() as connection:
+            connection.execute(text(f"DELETE FROM {meta_table}"))
+            connection.execute(
+                text(f"INSERT INTO {meta_table} (schema_version, applied_at) VALUES (:version, :applied_at)"),
+                {"version": schema_version, "applied_at": datetime.utcnow()}
+            )
+        return True
+
+    def warm_pool(self, size: Optional[int] = None) -> int:
+        """
+        Connection pool'u önceden doldurur
+
+        İlk request'lerin connection açma maliyetini startup'a taşır.
+        pool_size kadar connection checkout edilir ve hemen pool'a geri
+        bırakılır; böylece sonraki session'lar hazır connection bulur.
+        Read replica tanımlıysa onun pool'u da aynı şekilde ısıtılır.
+
+        ALGORITHM:
+        1. Engine durumunu kontrol et, gerekirse başlat
+        2. Hedef connection sayısını belirle (varsayılan: pool_size)
+        3. Her pool için (primary + read replica) connection'ları checkout et
+        4. Tümünü pool'a geri bırak
+
+        Args:
+            size (Optional[int]): Pool başına açılacak connection sayısı
+
+        Returns:
+            int: Isıtılan toplam connection sayısı
+        """
+        # Step 1: Engine durumu kontrolü
+        if not self.is_alive:
+            print("[DB ENGINE] - Engine not started, starting now")
+            self.start()
+
+        # Step 2: Hedef connection sayısı
+        target = size if size is not None else self.__engine_config.get('pool_size', 1)
+
+        # Step 3: Connection'ları checkout et
+        engines = [self.__engine] + ([self.__read_engine] if self.__read_engine else [])
+        warmed = 0
+        for engine in engines:
+            connections = []
+            try:
+                for _ in range(target):
+                    connections.append(engine.pool.connect())
+            finally:
+                # Step 4: Connection'ları pool'a geri bırak
+                for connection in connections:
+                    connection.close()
+            warmed += len(connections)
+
+        print(f"[DB ENGINE] - Connection pool warmed ({warmed} connections)")
+        return warmed
+
     def drop_tables(self, base_metadata) -> None:
         """
         Database schema'dan tüm tabloları siler
@@ -457,6 +621,25 @@ class DatabaseEngine:
         success = test_database_connection(self.__engine, self.__config.db_type.value)
         return success
 
+    def ping(self) -> bool:
+        """
+        Hafif bağlantı kontrolü (SELECT 1)
+
+        test_connection()'dan farklı olarak engine'i başlatmaz ve log
+        basmaz; health check gibi sık çağrılan yerler için tasarlanmıştır.
+
+        Returns:
+            bool: Database cevap veriyorsa True, aksi takdirde False
+        """
+        if not self.is_alive or self.__engine is None:
+            return False
+        try:
+            with self.__engine.connect() as connection:
+                connection.execute(text("SELECT 1")).scalar()
+            return True
+        except Exception:
+            return False
+
     def execute_raw_sql(self, sql: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """
         Ham SQL sorgusu çalıştırır
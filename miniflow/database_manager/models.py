@@ -54,6 +54,8 @@ BaseModel (Abstract)
 ├── Trigger
 └── AuditLog
 
+SchemaMeta (Base) - şema versiyon takibi
+
 ENUM CATEGORIES:
 ===============
 • Workflow States: ACTIVE, INACTIVE, DRAFT, ARCHIVED
@@ -595,6 +597,22 @@ class AuditLog(BaseModel):
     user_agent = Column(String(500), nullable=True)
 
 
+# Schema Meta Table
+SCHEMA_VERSION = 2  # Model/tablo/index tanımları değiştiğinde artırılmalı
+
+class SchemaMeta(Base):
+    """
+    SchemaMeta modeli - Uygulanmış şema versiyonunun takibi
+
+    Startup'ta her tablo için existence check yapmak yerine bu tek satırlık
+    tablo okunur; versiyon güncelse create_all tamamen atlanır.
+    """
+    __tablename__ = 'miniflow_meta'
+
+    schema_version = Column(Integer, primary_key=True)
+    applied_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
 # VERITABANI INDEKSLERI
 # ==============================================================
 INDEXES = [
@@ -641,4 +659,8 @@ INDEXES = [
     # Script lookups for payload creation
     "CREATE INDEX IF NOT EXISTS idx_nodes_script_id ON nodes(script_id)",
     "CREATE INDEX IF NOT EXISTS idx_scripts_path ON scripts(script_path)",
+
+    # Keyset pagination (created_at DESC, id DESC)
+    "CREATE INDEX IF NOT EXISTS idx_workflows_created_id ON workflows(created_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_executions_created_id ON executions(created_at, id)",
 ]
\ No newline at end of file
@@ -1,7 +1,11 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, raiseload
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from sqlalchemy import select, func
+import threading
+from collections import OrderedDict
+import uuid
+import enum
+from sqlalchemy import select, func, or_, and_
 
 from .crud import (
     WorkflowCRUD, NodeCRUD, EdgeCRUD, TriggerCRUD, 
@@ -12,12 +16,15 @@ from .crud import (
 from .models import (
     Workflow, Node, Edge, Trigger, Script, Execution, 
     ExecutionInput, ExecutionOutput, ArchivedExecution, AuditLog,
-    WorkflowStatus, ExecutionStatus, TriggerType, ConditionType, AuditAction
+    WorkflowStatus, ExecutionStatus, TriggerType, ConditionType, AuditAction,
+    ScriptType, TestStatus
 )
 from ..exceptions import ValidationError, BusinessLogicError
-from ..utils import extract_dynamic_node_params,  split_variable_reference
+from ..utils import extract_dynamic_node_params,  split_variable_reference, decode_page_cursor
 
 class DatabaseOrchestration:
+    NODE_IDS_CACHE_SIZE = 1024  # Node id cache'inde tutulacak en fazla execution sayısı (LRU)
+
     def __init__(self):
         self.workflow_crud = WorkflowCRUD()
         self.node_crud = NodeCRUD()
@@ -30,6 +37,11 @@ class DatabaseOrchestration:
         self.archived_execution_crud = ArchivedExecutionCRUD()
         self.audit_log_crud = AuditLogCRUD()
 
+        # execution_id -> {node_name: node_id}: execution süresince workflow node'ları değişmez,
+        # dinamik referanslar her task'te node adından yeniden çözülmez (execution bitince temizlenir).
+        # LRU ile sınırlı: arşivlenen/silinen/worker crash'i ile yarım kalan execution'lar sonsuza kadar birikmez
+        self._node_ids_by_execution: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        self._node_ids_lock = threading.Lock()
 
     # WORKFLOW FUNCTIONS
     # ==============================================================
@@ -412,6 +424,35 @@ class DatabaseOrchestration:
         # 5. Silinen script'i döndür
         return old_script
 
+    # PAGINATION FUNCTIONS
+    # ==============================================================
+    @staticmethod
+    def __paginate(crud, session: Session, page: Optional[int], page_size: Optional[int], after_id: Optional[str],
+                   options: tuple = ()):
+        # 1. Sayfa boyutunu belirle
+        limit = page_size or 100
+
+        # 2. Deprecated: page verilmişse OFFSET ile devam et (keyset ile aynı sıra: created_at DESC, id DESC)
+        if page is not None and after_id is None:
+            return crud.get_all(session, skip=max(page - 1, 0) * limit, limit=limit, options=options,
+                                order_by=(crud.model.created_at.desc(), crud.model.id.desc()))
+
+        # 3. Keyset pagination: en yeniden eskiye (created_at DESC, id DESC)
+        #    after_id = önceki sayfanın next_cursor'ı (created_at, id); anchor satır silinse de sayfalama devam eder
+        before = None
+        if after_id is not None:
+            before = decode_page_cursor(after_id)
+            if before is None:
+                # Eski tip düz ID: anchor satırın created_at değeri okunur, satır yoksa sessizce boş sayfa dönülmez
+                anchor = crud.find_by_id(session, after_id)
+                if anchor is None:
+                    raise ValidationError(
+                        f"Invalid pagination cursor: {after_id}",
+                        "The anchor record no longer exists; use next_cursor or restart from the first page"
+                    )
+                before = (anchor.created_at, anchor.id)
+        return crud.get_page_before(session, before=before, limit=limit, options=options)
+
     # ==============================================================
     # END-TO-END WORKFLOW FUNCTIONS
     # ==============================================================
@@ -471,6 +512,138 @@ class DatabaseOrchestration:
             'triggers': trigger_ids,
         }
 
+    def create_workflow_bulk(self, session: Session, workflow_data: dict):
+        """
+        Workflow'u bulk insert ile oluştur
+
+        Node, edge, trigger ve audit log kayıtları satır satır ORM create yerine
+        tablo başına tek bir executemany INSERT ile yazılır. Dönüş formatı
+        create_workflow ile aynıdır.
+        """
+        nodes = workflow_data["nodes"]
+        edges = workflow_data["edges"]
+        triggers = workflow_data.get("triggers", [])
+
+        # 1. Workflow oluştur
+        workflow = self.__workflow_create(session, **{'name':workflow_data["name"], 'description':workflow_data.get("description")})
+        now = datetime.utcnow()
+
+        # 2. Script ID'lerini tek sorguda çöz
+        script_names = []
+        for node_data in nodes:
+            if not node_data.get("script_name"):
+                raise ValidationError("Script name is required for node creation")
+            script_names.append(node_data["script_name"])
+        script_ids = self.script_crud.get_ids_by_names(session, script_names)
+
+        # 3. Node satırlarını hazırla
+        node_ids = {}
+        node_rows = []
+        for node_data in nodes:
+            node_name = node_data.get('name')
+            if node_name in node_ids:
+                raise ValidationError(f"Node with name '{node_name}' already exists in workflow")
+            script_id = script_ids.get(node_data["script_name"])
+            if not script_id:
+                raise BusinessLogicError(f"Script with name '{node_data['script_name']}' not found")
+
+            node_id = str(uuid.uuid4())
+            node_ids[node_name] = node_id
+            node_rows.append({
+                "id": node_id,
+                "created_at": now,
+                "updated_at": now,
+                "workflow_id": workflow.id,
+                "script_id": script_id,
+                "name": node_name,
+                "params": node_data.get("params") or {},
+                "max_retries": node_data.get("max_retries", 3),
+                "timeout_seconds": node_data.get("timeout_seconds", 300),
+            })
+
+        # 4. Edge satırlarını hazırla
+        edge_ids = []
+        edge_rows = []
+        for edge_data in edges:
+            from_node_name = edge_data["from_node"]
+            to_node_name = edge_data["to_node"]
+            if from_node_name not in node_ids or to_node_name not in node_ids:
+                raise ValidationError(f"Edge references unknown node: {from_node_name} -> {to_node_name}")
+
+            edge_id = str(uuid.uuid4())
+            edge_ids.append(edge_id)
+            edge_rows.append({
+                "id": edge_id,
+                "created_at": now,
+                "updated_at": now,
+                "workflow_id": workflow.id,
+                "from_node_id": node_ids[from_node_name],
+                "to_node_id": node_ids[to_node_name],
+                "condition_type": ConditionType(edge_data.get("condition_type", "success")),
+            })
+
+        # 5. Trigger satırlarını hazırla
+        trigger_ids = []
+        trigger_rows = []
+        for trigger_data in triggers:
+            trigger_id = str(uuid.uuid4())
+            trigger_ids.append(trigger_id)
+            trigger_rows.append({
+                "id": trigger_id,
+                "created_at": now,
+                "updated_at": now,
+                "workflow_id": workflow.id,
+                "trigger_type": TriggerType(trigger_data["trigger_type"]),
+                "trigger_config": trigger_data.get("config", {}),
+                "is_active": trigger_data.get("is_active", True),
+            })
+
+        # 6. Tablo başına tek INSERT + audit log kayıtları (ara flush'lar olmadan)
+        audit_rows = []
+        with session.no_autoflush:
+            for table, table_name, rows in (
+                (Node.__table__, "node", node_rows),
+                (Edge.__table__, "edge", edge_rows),
+                (Trigger.__table__, "trigger", trigger_rows),
+            ):
+                if not rows:
+                    continue
+                session.execute(table.insert(), rows)
+                for row in rows:
+                    audit_rows.append({
+                        "id": str(uuid.uuid4()),
+                        "created_at": now,
+                        "updated_at": now,
+                        "table_name": table_name,
+                        "record_id": row["id"],
+                        "action": AuditAction.CREATE,
+                        "old_values": None,
+                        "new_values": self.__row_to_audit_values(row),
+                    })
+            if audit_rows:
+                session.execute(AuditLog.__table__.insert(), audit_rows)
+
+        # 7. Sonuçları döndür
+        return {
+            'workflow_id': workflow.id,
+            'created_at': workflow.created_at.isoformat() if workflow.created_at else None,
+            'nodes': node_ids,
+            'edges': edge_ids,
+            'triggers': trigger_ids,
+        }
+
+    @staticmethod
+    def __row_to_audit_values(row: dict) -> dict:
+        """Bulk insert satırını to_dict() formatına çevir (audit log için)"""
+        values = {}
+        for key, value in row.items():
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, enum.Enum):
+                value = value.value
+            values[key] = value
+        return values
+
     def delete_workflow(self, session: Session, workflow_id: str):
         """
         Workflow'u ve tüm bileşenlerini sil
@@ -514,11 +687,17 @@ class DatabaseOrchestration:
             'triggers': created_result['triggers'],
         }
 
-    def get_workflows(self, session: Session, page: Optional[int] = None, page_size: Optional[int] = None):
+    def get_workflows(self, session: Session, page: Optional[int] = None, page_size: Optional[int] = None,
+                      after_id: Optional[str] = None):
         """
-        Tüm workflow'ları listele
+        Workflow'ları listele - keyset pagination (after_id)
+
+        NOT: page parametresi geriye dönük uyumluluk için korunuyor (OFFSET kullanır)
+        NOT: Liste DTO'su sadece kolonları kullanır; raiseload('*') ile satır başına
+             gizli lazy-load (N+1) yapılamaz, ilişki gerekiyorsa selectinload eklenmeli
         """
-        workflows = self.workflow_crud.get_all(session)
+        workflows = self.__paginate(self.workflow_crud, session, page, page_size, after_id,
+                                    options=(raiseload('*'),))
         workflow_list = []
         for workflow in workflows:
             workflow_dict = workflow.to_dict()
@@ -527,6 +706,25 @@ class DatabaseOrchestration:
             
         return workflow_list
 
+    def get_workflow_batch(self, session: Session, after_id: Optional[str] = None, batch_size: int = 100):
+        """
+        Stream için bir sonraki workflow batch'ini getir - id sırasında keyset (id > after_id)
+
+        Returns:
+            (workflow dict listesi, sonraki batch'in cursor'ı)
+        """
+        stmt = select(Workflow).options(raiseload('*')).order_by(Workflow.id).limit(batch_size)
+        if after_id is not None:
+            stmt = stmt.where(Workflow.id > after_id)
+
+        workflow_list = []
+        for workflow in session.execute(stmt).scalars():
+            workflow_dict = workflow.to_dict()
+            workflow_dict['workflow_id'] = workflow_dict['id']
+            workflow_list.append(workflow_dict)
+
+        return workflow_list, (workflow_list[-1]['id'] if workflow_list else after_id)
+
     def get_workflow(self, session: Session, workflow_id: str):
         """
         Workflow detayını getir (nodes, edges, triggers dahil)
@@ -555,6 +753,36 @@ class DatabaseOrchestration:
         
         return workflow_dict
 
+    def get_workflows_by_ids(self, session: Session, workflow_ids: List[str]) -> Dict[str, dict]:
+        """
+        Birden fazla workflow detayını tek seferde getir (nodes, edges, triggers dahil)
+
+        N workflow için 1 + 3 sorgu: WHERE id IN (...) + her ilişki için selectinload.
+        Bulunamayan id'ler sonuçta yer almaz.
+        """
+        if not workflow_ids:
+            return {}
+
+        stmt = (
+            select(Workflow)
+            .where(Workflow.id.in_(set(workflow_ids)))
+            .options(
+                selectinload(Workflow.nodes),
+                selectinload(Workflow.edges),
+                selectinload(Workflow.triggers),
+            )
+        )
+
+        result = {}
+        for workflow in session.execute(stmt).scalars():
+            workflow_dict = workflow.to_dict()
+            workflow_dict['workflow_id'] = workflow_dict['id']
+            workflow_dict['nodes'] = [node.to_dict() for node in workflow.nodes]
+            workflow_dict['edges'] = [edge.to_dict() for edge in workflow.edges]
+            workflow_dict['triggers'] = [trigger.to_dict() for trigger in workflow.triggers]
+            result[workflow.id] = workflow_dict
+        return result
+
     # END-TO-END SCRIPT FUNCTIONS
     # ==============================================================
     def create_script(self, session: Session, script_data: dict):
@@ -571,6 +799,55 @@ class DatabaseOrchestration:
 
         return api_payload
 
+    def create_scripts_bulk(self, session: Session, scripts_data: List[dict]):
+        """
+        Birden fazla script'i tek INSERT ile oluştur
+        """
+        # 1. İsim çakışmalarını tek sorguda kontrol et
+        names = [script_data['name'] for script_data in scripts_data]
+        if len(set(names)) != len(names):
+            raise ValidationError("Duplicate script names in batch")
+        existing = self.script_crud.get_ids_by_names(session, names)
+        if existing:
+            raise ValidationError(f"Script with name '{next(iter(existing))}' already exists")
+
+        # 2. Script satırlarını hazırla
+        now = datetime.utcnow()
+        script_rows = []
+        for script_data in scripts_data:
+            script_rows.append({
+                "id": str(uuid.uuid4()),
+                "created_at": now,
+                "updated_at": now,
+                "name": script_data['name'],
+                "description": script_data.get('description'),
+                "language": ScriptType.PYTHON,
+                "script_path": script_data['script_path'],
+                "input_params": script_data.get('input_params') or {},
+                "output_params": script_data.get('output_params') or {},
+                "test_status": TestStatus.UNTESTED,
+            })
+
+        # 3. Tek INSERT + audit log kayıtları
+        session.execute(Script.__table__.insert(), script_rows)
+        session.execute(AuditLog.__table__.insert(), [{
+            "id": str(uuid.uuid4()),
+            "created_at": now,
+            "updated_at": now,
+            "table_name": "script",
+            "record_id": row["id"],
+            "action": AuditAction.CREATE,
+            "old_values": None,
+            "new_values": self.__row_to_audit_values(row),
+        } for row in script_rows])
+
+        # 4. Sonuçları döndür
+        return [{
+            'script_id': row['id'],
+            'absolute_path': row['script_path'],
+            'created_at': now.isoformat()
+        } for row in script_rows]
+
     def delete_script(self, session: Session, script_id: str):
         """
         Script'i sil - Usage kontrolü ile
@@ -588,14 +865,31 @@ class DatabaseOrchestration:
         """
         Tüm script'leri listele
         """
-        scripts = self.script_crud.get_all(session)
-        script_list = []
-        for script in scripts:
-            script_dict = script.to_dict()
-            script_dict['script_id'] = script_dict['id']  # Add consistent field name
-            script_list.append(script_dict)
+        stmt = select(Script).order_by(Script.created_at, Script.id)
+        return [self.__script_to_dict(script) for script in session.execute(stmt).scalars()]
+
+    def get_script_batch(self, session: Session, after: Optional[tuple] = None, batch_size: int = 1000):
+        """
+        Stream için bir sonraki script batch'ini getir - (created_at, id) sırasında keyset
 
-        return script_list
+        Returns:
+            (script dict listesi, sonraki batch'in cursor'ı: son satırın (created_at, id) değeri)
+        """
+        stmt = select(Script).order_by(Script.created_at, Script.id).limit(batch_size)
+        if after is not None:
+            created_at, script_id = after
+            stmt = stmt.where(or_(Script.created_at > created_at,
+                                  and_(Script.created_at == created_at, Script.id > script_id)))
+
+        scripts = session.execute(stmt).scalars().all()
+        cursor = (scripts[-1].created_at, scripts[-1].id) if scripts else after
+        return [self.__script_to_dict(script) for script in scripts], cursor
+
+    @staticmethod
+    def __script_to_dict(script) -> dict:
+        script_dict = script.to_dict()
+        script_dict['script_id'] = script_dict['id']  # Add consistent field name
+        return script_dict
 
     def get_script(self, session: Session, script_id: str, include_content: bool = False):
         """
@@ -613,13 +907,33 @@ class DatabaseOrchestration:
         
         # 3. Eğer content isteniyorsa, dosyadan oku
         if include_content and script.script_path:
-            try:
-                with open(script.script_path, 'r') as f:
-                    script_dict['file_content'] = f.read()
-            except Exception as e:
-                script_dict['file_content'] = f"Error reading file: {str(e)}"
+            script_dict['file_content'] = self.__read_script_content(script.script_path)
         
         return script_dict
+
+    def get_scripts_by_ids(self, session: Session, script_ids: List[str],
+                           include_content: bool = False) -> Dict[str, dict]:
+        """
+        Birden fazla script detayını tek WHERE id IN (...) sorgusu ile getir
+
+        Bulunamayan id'ler sonuçta yer almaz.
+        """
+        result = {}
+        for script in self.script_crud.select_in_bulk(session, list(set(script_ids))):
+            script_dict = script.to_dict()
+            script_dict['script_id'] = script_dict['id']
+            if include_content and script.script_path:
+                script_dict['file_content'] = self.__read_script_content(script.script_path)
+            result[script.id] = script_dict
+        return result
+
+    @staticmethod
+    def __read_script_content(script_path: str) -> str:
+        try:
+            with open(script_path, 'r') as f:
+                return f.read()
+        except Exception as e:
+            return f"Error reading file: {str(e)}"
     
 
     #  EXECUTION FUNCTIONS
@@ -816,15 +1130,32 @@ class DatabaseOrchestration:
         
         return execution_dict
 
-    def get_executions(self, session: Session, page: Optional[int] = None, page_size: Optional[int] = None):
+    def get_executions(self, session: Session, page: Optional[int] = None, page_size: Optional[int] = None,
+                       after_id: Optional[str] = None):
         """
-        Tüm execution'ları listele
+        Execution'ları listele - keyset pagination (after_id)
+
+        NOT: page parametresi geriye dönük uyumluluk için korunuyor (OFFSET kullanır)
         """
-        executions = self.execution_crud.get_all(session)
+        executions = self.__paginate(self.execution_crud, session, page, page_size, after_id)
         execution_list = [execution.to_dict() for execution in executions]
 
         return execution_list
 
+    def get_execution_batch(self, session: Session, after_id: Optional[str] = None, batch_size: int = 100):
+        """
+        Stream için bir sonraki execution batch'ini getir - id sırasında keyset (id > after_id)
+
+        Returns:
+            (execution dict listesi, sonraki batch'in cursor'ı)
+        """
+        stmt = select(Execution).order_by(Execution.id).limit(batch_size)
+        if after_id is not None:
+            stmt = stmt.where(Execution.id > after_id)
+
+        execution_list = [execution.to_dict() for execution in session.execute(stmt).scalars()]
+        return execution_list, (execution_list[-1]['id'] if execution_list else after_id)
+
     def cancel_execution(self, session: Session, execution_id: str):
         """
         Execution'ı iptal et
@@ -850,6 +1181,7 @@ class DatabaseOrchestration:
             'ended_at': datetime.utcnow(),
         }
         execution = self.execution_crud.update(session, execution_id, **execution_payload)
+        self.clear_context_cache(execution_id)
 
         return {
             'execution_id': execution.id,
@@ -902,7 +1234,7 @@ class DatabaseOrchestration:
             
             # Resolve dynamic parameters
             resolved_params = self._resolve_dynamic_parameters(
-                session, execution_id, node_params
+                session, execution_id, node_params, task.get('workflow_id')
             )
             
             # Create the execution payload
@@ -926,30 +1258,32 @@ class DatabaseOrchestration:
             return None
 
     def _resolve_dynamic_parameters(self, session: Session, execution_id: str, 
-                                  node_params: Dict[str, Any]) -> Dict[str, Any]:
+                                  node_params: Dict[str, Any], workflow_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Resolve dynamic parameters in node_params
         Supports two formats:
         1. {{node_name.variable_name}} - Template format  
         2. node_name.variable_name - Direct format
+
+        workflow_id verilirse node adları execution başına cache'lenen id map'iyle çözülür
         """
         if not node_params:
             return {}
             
         resolved_params = {}
+        references = {}  # param_key -> (original_value, reference); referans içeren parametreler
         
         # First, extract {{}} format dynamic parameters
-        from ..utils import extract_dynamic_node_params
+        from ..utils import extract_dynamic_node_params, split_variable_reference
         template_params = extract_dynamic_node_params(node_params)
         
+        # 1. Parametreleri sınıflandır: statikler hemen yazılır, referanslar toplanır
         for param_key, param_value in node_params.items():
             try:
                 # Check if this parameter has a template format {{}}
                 if param_key in template_params:
                     # Use the extracted value (already cleaned from {{}})
-                    reference = template_params[param_key]
-                    resolved_value = self._resolve_single_reference(session, execution_id, reference)
-                    resolved_params[param_key] = resolved_value
+                    references[param_key] = (param_value, template_params[param_key])
                     
                 # Check if this is a direct format (node_name.variable_name)
                 elif isinstance(param_value, str) and '.' in param_value:
@@ -973,8 +1307,7 @@ class DatabaseOrchestration:
                         is_dynamic = False
                     
                     if is_dynamic:
-                        resolved_value = self._resolve_single_reference(session, execution_id, param_value)
-                        resolved_params[param_key] = resolved_value
+                        references[param_key] = (param_value, param_value)
                     else:
                         # Treat as static parameter
                         resolved_params[param_key] = param_value
@@ -987,33 +1320,72 @@ class DatabaseOrchestration:
                 # On any error, use original value
                 print(f"[ORCHESTRATION] Error resolving parameter {param_key}: {e}")
                 resolved_params[param_key] = param_value
-                
-        return resolved_params
-    
-    def _resolve_single_reference(self, session: Session, execution_id: str, reference: str) -> Any:
-        """
-        Resolve a single dynamic reference (node_name.variable_name)
-        Returns the resolved value or original reference if not found
-        """
+
+        if not references:
+            return resolved_params
+
+        # 2. Referansları ayrıştır; geçersiz referans orijinal referans değerine döner
+        parsed_references = {}
+        for param_key, (param_value, reference) in references.items():
+            try:
+                parsed_references[param_key] = (reference, *split_variable_reference(reference))
+            except Exception as e:
+                print(f"[ORCHESTRATION] Error resolving reference {reference}: {e}")
+                resolved_params[param_key] = reference
+
+        # 3. Referans verilen tüm node'ların çıktıları tek IN sorgusuyla okunur (referans başına sorgu yok)
         try:
-            from ..utils import split_variable_reference
-            referenced_node_name, variable_name = split_variable_reference(reference)
-            
-            # Get the result data from the referenced node
-            result_data = self.execution_output_crud.get_node_result_data(
-                session, execution_id, referenced_node_name
-            )
-            
+            node_names = list({node_name for _, node_name, _ in parsed_references.values()})
+            if workflow_id:
+                node_ids = self._get_execution_node_ids(session, execution_id, workflow_id)
+                results_by_id = self.execution_output_crud.get_result_data_by_node_ids(
+                    session, execution_id, [node_ids[name] for name in node_names if name in node_ids]
+                )
+                results_by_node = {name: results_by_id[node_ids[name]]
+                                   for name in node_names if node_ids.get(name) in results_by_id}
+            else:
+                results_by_node = self.execution_output_crud.get_result_data_by_node_names(
+                    session, execution_id, node_names
+                )
+        except Exception as e:
+            print(f"[ORCHESTRATION] Error loading referenced node results: {e}")
+            for param_key, (reference, _, _) in parsed_references.items():
+                resolved_params[param_key] = reference
+            parsed_references = {}
+
+        # 4. Referansları bellekte çöz
+        for param_key, (reference, node_name, variable_name) in parsed_references.items():
+            result_data = results_by_node.get(node_name)
             if result_data and variable_name in result_data:
-                return result_data[variable_name]
+                resolved_params[param_key] = result_data[variable_name]
             else:
                 # If reference not found, return original reference
                 print(f"[ORCHESTRATION] Dynamic reference not found: {reference}")
-                return reference
-                
-        except Exception as e:
-            print(f"[ORCHESTRATION] Error resolving reference {reference}: {e}")
-            return reference
+                resolved_params[param_key] = reference
+
+        # Parametre sırası node_params ile aynı kalsın
+        return {param_key: resolved_params[param_key] for param_key in node_params}
+
+    def _get_execution_node_ids(self, session: Session, execution_id: str, workflow_id: str) -> Dict[str, str]:
+        """Execution'ın workflow node'ları için {node_name: node_id}; ilk çağrıda tek sorguyla doldurulur"""
+        # Get-or-populate lock altında: aynı execution için sorgu tekrarlanmaz ve LRU sırası tutarlı kalır
+        with self._node_ids_lock:
+            node_ids = self._node_ids_by_execution.get(execution_id)
+            if node_ids is not None:
+                self._node_ids_by_execution.move_to_end(execution_id)
+                return node_ids
+
+            rows = session.execute(select(Node.name, Node.id).where(Node.workflow_id == workflow_id)).all()
+            node_ids = {row.name: row.id for row in rows}
+            self._node_ids_by_execution[execution_id] = node_ids
+            if len(self._node_ids_by_execution) > self.NODE_IDS_CACHE_SIZE:
+                self._node_ids_by_execution.popitem(last=False)
+            return node_ids
+
+    def clear_context_cache(self, execution_id: str) -> None:
+        """Execution bittiğinde/iptal edildiğinde node id cache'ini bırak"""
+        with self._node_ids_lock:
+            self._node_ids_by_execution.pop(execution_id, None)
 
     def process_execution_result(self, session: Session, result: Dict[str, Any]) -> bool:
         """
@@ -1238,6 +1610,7 @@ class DatabaseOrchestration:
                 ended_at=datetime.utcnow()
             )
             
+            self.clear_context_cache(execution_id)
             print(f"[ORCHESTRATION] Execution {execution_id} completed with status {final_status.value}")
             
         except Exception as e:
@@ -1,6 +1,7 @@
 from typing import Dict, Any, Callable
 from datetime import datetime
 from functools import wraps
+import inspect
 import logging
 
 logger = logging.getLogger(__name__)
@@ -109,6 +110,19 @@ class ErrorManager:
     @staticmethod
     def operation_context(operation_name: str):
         def decorator(func: Callable) -> Callable:
+            if inspect.iscoroutinefunction(func):
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    try:
+                        logger.debug(f"Starting operation: {operation_name}")
+                        result = await func(*args, **kwargs)
+                        logger.debug(f"Completed operation: {operation_name}")
+                        return result
+                    except Exception as e:
+                        ErrorManager._raise_for_operation(e, operation_name)
+
+                return async_wrapper
+
             @wraps(func)
             def wrapper(*args, **kwargs):
                 try:
@@ -116,26 +130,33 @@ class ErrorManager:
                     result = func(*args, **kwargs)
                     logger.debug(f"Completed operation: {operation_name}")
                     return result
-                
-                except MiniflowException:
-                    # Re-raise custom exceptions as-is
-                    logger.warning(f"Business error in {operation_name}")
-                    raise
-
-                except OSError as e:
-                    # File system errors
-                    error_msg = f"File system error in {operation_name}"
-                    logger.error(f"{error_msg}: {str(e)}")
-                    raise ResourceError(error_msg, str(e))
-                
                 except Exception as e:
-                    # Smart exception mapping based on operation context and exception type
-                    mapped_exception = ErrorManager._map_exception_to_context(e, operation_name)
-                    logger.error(f"Unexpected error in {operation_name}: {str(e)}", exc_info=True)
-                    raise mapped_exception
+                    ErrorManager._raise_for_operation(e, operation_name)
                 
             return wrapper
         return decorator
+
+    @staticmethod
+    def _raise_for_operation(exception: Exception, operation_name: str):
+        """
+        operation_context'in sync ve async wrapper'ları için ortak hata eşleme
+        (iki yol aynı except kollarını ve log mesajlarını kullanır)
+        """
+        if isinstance(exception, MiniflowException):
+            # Re-raise custom exceptions as-is
+            logger.warning(f"Business error in {operation_name}")
+            raise exception
+
+        if isinstance(exception, OSError):
+            # File system errors
+            error_msg = f"File system error in {operation_name}"
+            logger.error(f"{error_msg}: {str(exception)}")
+            raise ResourceError(error_msg, str(exception)) from exception
+
+        # Smart exception mapping based on operation context and exception type
+        mapped_exception = ErrorManager._map_exception_to_context(exception, operation_name)
+        logger.error(f"Unexpected error in {operation_name}: {str(exception)}", exc_info=exception)
+        raise mapped_exception from exception
     
     @staticmethod
     def _map_exception_to_context(exception: Exception, operation_name: str) -> MiniflowException:
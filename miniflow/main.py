@@ -1,12 +1,20 @@
+import asyncio
+import atexit
+import copy
 import logging
+import queue
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Iterator, Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 # Utility
 from .utils import setup_logging
 from .utils import create_script, delete_script
+from .utils.data_loader import DataLoader
 
 # Exceptions
 from .exceptions import MiniflowException, ErrorManager
@@ -15,44 +23,188 @@ from .exceptions import (DatabaseError, SchedulerError, EngineError,
                          ValidationError, BusinessLogicError, ResourceError)
 
 # Database
-from .database_manager import DatabaseConfig, DatabaseEngine, DatabaseOrchestration, Base
+from .database_manager import DatabaseConfig, DatabaseEngine, DatabaseOrchestration, Base, SCHEMA_VERSION, INDEXES
 from .database_manager import get_sqlite_config, get_mysql_config, get_postgresql_config
 from .database_manager import create_database_engine
 
-# Parallelism Engine
-from .parallelism_engine import Manager
+# Parallelism Engine & Scheduler: multiprocessing zincirini import'ta yüklememek için
+# ilgili start metotlarında lazy import edilir
+if TYPE_CHECKING:
+    from .database_manager.async_engine import AsyncDatabaseEngine
+    from .parallelism_engine import Manager
+    from .scheduler import MiniflowInputMonitor, MiniflowOutputMonitor
 
-# Scheduler
-from .scheduler import MiniflowInputMonitor, MiniflowOutputMonitor
+# Database config factory'leri (MiniflowCore db_type parametresi -> DatabaseConfig)
+# Yeni driver eklemek için sadece _CONFIG_FACTORIES'e bir giriş eklenir
+_POOL_PARAM_KEYS = ('read_url', 'pool_size', 'max_overflow', 'pool_timeout', 'pool_pre_ping', 'pool_recycle')
 
-setup_logging()
+
+def _pool_params(db_params: dict) -> dict:
+    # Sadece kullanıcının verdiği anahtarlar iletilir; geri kalanlar DB_ENGINE_CONFIGS'teki dialect varsayılanlarından gelir
+    return {key: db_params[key] for key in _POOL_PARAM_KEYS if key in db_params}
+
+
+def _sqlite_config(**db_params) -> DatabaseConfig:
+    return get_sqlite_config(db_params.get("db_name", "test_database"))
+
+
+def _postgresql_config(**db_params) -> DatabaseConfig:
+    return get_postgresql_config(
+        db_name=db_params.get('db_name', 'workflow_db'),
+        host=db_params.get('host', 'localhost'),
+        port=db_params.get('port', 5432),
+        username=db_params.get('username', 'postgres'),
+        password=db_params.get('password', 'password'),
+        **_pool_params(db_params)
+    )
+
+
+def _mysql_config(**db_params) -> DatabaseConfig:
+    return get_mysql_config(
+        db_name=db_params.get('db_name', 'workflow_db'),
+        host=db_params.get('host', 'localhost'),
+        port=db_params.get('port', 3306),
+        username=db_params.get('username', 'root'),
+        password=db_params.get('password', 'password'),
+        **_pool_params(db_params)
+    )
+
+
+_CONFIG_FACTORIES = {
+    "sqlite": _sqlite_config,
+    "postgresql": _postgresql_config,
+    "mysql": _mysql_config,
+}
+
+# Logging import sırasında değil, ilk MiniflowCore.start() çağrısında kurulur
+_LOGGING_INITIALIZED = False
 logger = logging.getLogger(__name__)
-logger.debug(f"Logger tanımları tanımlandı")
+
+
+def _iso_now() -> str:
+    """UTC zamanını ISO-8601 (mikrosaniye, 'Z' sonekli) olarak döndürür"""
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds)) + f".{nanoseconds // 1000:06d}Z"
+
+
+def _isoformat_or_none(value) -> Optional[str]:
+    """datetime değerini ISO-8601 string'e çevirir, None ise None döndürür"""
+    return value.isoformat() if value else None
+
+
+class MiniflowBatch:
+    """
+    MiniflowCore.batch() tarafından döndürülen unit-of-work handle'ı
+
+    Tüm işlemler tek session üzerinde çalışır ve batch sonunda tek commit yapılır.
+    Sonraki işlemler önceki işlemlerin ID'lerini kullanabilir (CRUD create flush eder).
+    Batch içinde core'un public yazma metotları değil, bu handle'ın metotları kullanılır.
+    """
+
+    def __init__(self, core: "MiniflowCore", session):
+        self._core = core
+        self._session = session
+        self._written_files: list = []
+        self._triggered: bool = False
+
+    def script_create(self, script_data: dict, script_content: str) -> dict:
+        return self._core._do_script_create(self._session, script_data, script_content, self._written_files)
+
+    def workflow_create(self, workflow_data: dict, use_bulk_insert: Optional[bool] = None) -> dict:
+        return self._core._do_workflow_create(self._session, workflow_data, use_bulk_insert)
+
+    def workflow_update(self, workflow_id: str, workflow_data: dict) -> dict:
+        return self._core._do_workflow_update(self._session, workflow_id, workflow_data)
+
+    def workflow_delete(self, workflow_id: str) -> dict:
+        return self._core._do_workflow_delete(self._session, workflow_id)
+
+    def trigger_workflow(self, workflow_id: str) -> dict:
+        result = self._core._do_trigger_workflow(self._session, workflow_id)
+        # Input monitor batch commit edildikten sonra uyandırılır
+        self._triggered = True
+        return result
+
+    def cancel_execution(self, execution_id: str) -> dict:
+        return self._core._do_cancel_execution(self._session, execution_id)
 
 
 class MiniflowCore:
+    SCHEDULER_STOP_TIMEOUT = 30  # Monitor başına en fazla bekleme süresi (saniye)
+    BULK_INSERT_THRESHOLD = 50   # Bu node sayısının üstünde workflow_create bulk insert kullanır
+    TRIGGER_BATCH_WINDOW = 0.005 # trigger_workflow çağrılarının biriktirildiği pencere (saniye)
+    TRIGGER_BATCH_SIZE = 100     # Tek transaction'da işlenecek en fazla trigger sayısı
+    TRIGGER_RESULT_TIMEOUT = 60  # Coalescer sonucunu bekleme sınırı (saniye)
+
     def __init__(self, db_type: str, enable_scheduler: bool = True, **db_params):
         # Database
         self.db_type: str = db_type
         self.db_engine: DatabaseEngine = None
         self.orchestration: DatabaseOrchestration = None
-        self.scripts_dir: Path = Path("scripts")
+        self.scripts_dir: Path = Path("scripts").resolve()
+        self.scripts_dir.mkdir(parents=True, exist_ok=True)
         self.db_config: DatabaseConfig = self.__create_config(db_type, **db_params)
+        # Async okuma yolu (opsiyonel): async driver'lar kuruluysa AsyncSession kullanılır
+        self.async_db_engine: Optional["AsyncDatabaseEngine"] = None
+        self._use_async_engine: bool = db_params.get('async_engine', False)
+        # Yazma işlemleri için admission control: pool doluyken hata yerine sırada bekle
+        # Kapasite çözümlenmiş engine config'ten gelir (pool_size + max_overflow; SQLite için 1)
+        engine_config = self.db_config.engine_config
+        self._write_sem = threading.BoundedSemaphore(value=max(1, engine_config.pool_size + engine_config.max_overflow))
+        self._write_gate_timeout: float = engine_config.pool_timeout   # Bekleme sınırı: pool_timeout ile aynı backpressure
+        # Semaphore reentrant değil: aynı thread'de iç içe alım (örn. batch içinde core.workflow_create) deadlock yerine hata verir
+        self._write_gate_local = threading.local()
         
         # Parallelism Engine
-        self.execution_engine: Manager = None
+        self.execution_engine: "Manager" = None
         
         # Scheduler
         self.enable_scheduler: bool = enable_scheduler
-        self.input_monitor: MiniflowInputMonitor = None
-        self.output_monitor: MiniflowOutputMonitor = None
+        self.input_monitor: "MiniflowInputMonitor" = None
+        self.output_monitor: "MiniflowOutputMonitor" = None
+        self._input_event: threading.Event = threading.Event()    # Yeni hazır görev bildirimi
+
+        # Trigger coalescer: eşzamanlı trigger_workflow çağrıları tek transaction'da yazılır
+        self._trigger_queue: queue.Queue = queue.Queue()
+        self._trigger_thread: Optional[threading.Thread] = None
+        # Sentinel'den sonra kuyruğa eleman girmesin diye kabul durumu lock altında değişir
+        self._trigger_lock = threading.Lock()
+        self._trigger_accepting: bool = False
+
+        # DataLoader: aynı event loop tick'inde gelen tekil get'ler tek IN sorgusunda birleşir
+        self._script_loader = DataLoader(self.__load_scripts,
+                                         lambda script_id: BusinessLogicError(f"Script not found: {script_id}"))
+        self._workflow_loader = DataLoader(self.__load_workflows,
+                                           lambda workflow_id: BusinessLogicError(f"Workflow not found: {workflow_id}"))
+
+        # Lifecycle: stop() birden fazla yerden (lifespan, atexit, finally) çağrılabilir, tek sefer çalışır
+        self._running: bool = False
+        self._lifecycle_lock = threading.Lock()
+
+        # Health check cache (load balancer probe'ları her seferinde DB'ye gitmesin)
+        self._health_check_ttl: float = 0.5
+        self._health_check_lock = threading.Lock()
+        self._last_health_check: Optional[dict] = None
+        self._last_health_check_key: Optional[tuple] = None
+        self._last_health_check_at: float = 0.0
+        self._health_check_refreshing: bool = False
         
-        logger.debug(f"MiniflowCore initialized with scheduler={'enabled' if enable_scheduler else 'disabled'}")
+        logger.debug("MiniflowCore initialized with scheduler=%s", 'enabled' if enable_scheduler else 'disabled')
 
     @ErrorManager.operation_context("core_startup")
     def start(self) -> None:
+        # 0. Logging'i (bir kez) kur
+        global _LOGGING_INITIALIZED
+        if not _LOGGING_INITIALIZED:
+            setup_logging()
+            _LOGGING_INITIALIZED = True
+
+        # Başlatma yarıda kalsa bile stop() kısmi kaynakları temizleyebilsin
+        self._running = True
+
         # 1. Database'i başlat
         self.__start_database_engine()
+        self.__start_trigger_coalescer()
         
         # 2. Parallelism Engine'i başlat
         self.__start_parallelism_engine()
@@ -61,22 +213,29 @@ class MiniflowCore:
         if self.enable_scheduler:
             self.__start_scheduler()
         
-        logger.info(f"MiniflowCore started successfully (scheduler={'enabled' if self.enable_scheduler else 'disabled'})")
+        logger.info("MiniflowCore started successfully (scheduler=%s)", 'enabled' if self.enable_scheduler else 'disabled')
 
     @ErrorManager.operation_context("core_shutdown")
     def stop(self) -> None:
-        # Reverse order shutdown: Scheduler -> Engine -> Database
-        
-        # 1. Scheduler'ı durdur
-        if self.enable_scheduler:
-            self.__stop_scheduler()
-        
-        # 2. Parallelism Engine'i durdur
-        self.__stop_parallelism_engine()
-        
-        # 3. Database'i durdur
-        self.__stop_database_engine()
-        
+        # Idempotent: ikinci çağrı (sinyal + atexit gibi) shutdown'ı tekrar çalıştırmaz
+        with self._lifecycle_lock:
+            if not self._running:
+                return
+            self._running = False
+
+            # Reverse order shutdown: Scheduler -> Engine -> Database
+
+            # 1. Scheduler'ı durdur
+            if self.enable_scheduler:
+                self.__stop_scheduler()
+
+            # 2. Parallelism Engine'i durdur
+            self.__stop_parallelism_engine()
+
+            # 3. Database'i durdur
+            self.__stop_trigger_coalescer()
+            self.__stop_database_engine()
+
         logger.info("MiniflowCore stopped successfully")
 
     # DATABASE MANAGER METOTLARI
@@ -84,31 +243,15 @@ class MiniflowCore:
 
     @staticmethod
     def __create_config(db_type: str, **db_params):
-        config_map = {
-            "sqlite": lambda: get_sqlite_config(db_params.get("db_name", "test_database")),
-            "postgresql": lambda: get_postgresql_config(
-                db_name=db_params.get('db_name', 'workflow_db'),
-                host=db_params.get('host', 'localhost'),
-                port=db_params.get('port', 5432),
-                username=db_params.get('username', 'postgres'),
-                password=db_params.get('password', 'password')
-            ),
-            "mysql": lambda: get_mysql_config(
-                db_name=db_params.get('db_name', 'workflow_db'),
-                host=db_params.get('host', 'localhost'),
-                port=db_params.get('port', 3306),
-                username=db_params.get('username', 'root'),
-                password=db_params.get('password', 'password')
-            )
-        }
-
-        if db_type not in config_map:
+        # Sadece istenen database türünün config'i oluşturulur
+        try:
+            factory = _CONFIG_FACTORIES[db_type]
+        except KeyError:
             raise ValidationError(
                 f"Unsupported database type: {db_type}",
-                f"Supported types: {list(config_map.keys())}"
-            )
-        
-        return config_map[db_type]()
+                f"Supported types: {list(_CONFIG_FACTORIES)}"
+            ) from None
+        return factory(**db_params)
         
     def __start_database_engine(self):
         try: 
@@ -118,14 +261,24 @@ class MiniflowCore:
             # 2. Engine başlat
             self.db_engine.start()
 
-            # 3. Tabloları oluştur
-            self.db_engine.create_tables(Base.metadata)
+            # 3. Connection pool'u arka planda ısıt (ilk request'ler hazır connection bulsun)
+            #    Şema kontrolünden bağımsız olduğu için DDL round-trip'i ile paralel yürür
+            warmup_thread = threading.Thread(target=self.__warm_pool, name="DBPoolWarmupThread", daemon=True)
+            warmup_thread.start()
+
+            try:
+                # 4. Tabloları oluştur (şema versiyonu güncelse atlanır)
+                self.db_engine.ensure_tables(Base.metadata, SCHEMA_VERSION, extra_ddl=INDEXES)
+
+                # 5. Orchestration başlat
+                self.orchestration = DatabaseOrchestration()
+            finally:
+                warmup_thread.join()
 
-            # 4. Orchestration başlat
-            self.orchestration = DatabaseOrchestration()
+            # 6. Async engine (opsiyonel)
+            if self._use_async_engine:
+                self.__start_async_engine()
 
-            # 5. Scripts klasörünü oluştur
-            self.scripts_dir.mkdir(exist_ok=True)
             logger.info("Database engine started successfully")
 
         except Exception as e:
@@ -141,18 +294,132 @@ class MiniflowCore:
                 f"Error during initialization: {str(e)}"
             )
 
+    def __warm_pool(self):
+        """Warm the connection pool; failures only cost the first requests a connect"""
+        try:
+            self.db_engine.warm_pool()
+        except Exception as e:
+            logger.warning("Connection pool warmup failed: %s", e)
+
+    def __start_async_engine(self):
+        """Start the optional AsyncSession engine; fall back to worker threads if drivers are missing"""
+        try:
+            # Lazy import: sqlalchemy.ext.asyncio greenlet gerektirir, async_engine kapalıyken yüklenmez
+            from .database_manager.async_engine import AsyncDatabaseEngine
+            async_engine = AsyncDatabaseEngine(self.db_config)
+            async_engine.start()
+            self.async_db_engine = async_engine
+        except (ImportError, ValueError) as e:
+            # greenlet eksikliği SQLAlchemy sürümüne göre ImportError veya ValueError olarak gelir
+            logger.warning("Async database driver not available, async reads will use worker threads: %s", e)
+
     def __stop_database_engine(self):
+        if self.async_db_engine:
+            try:
+                self.async_db_engine.stop()
+            except Exception as e:
+                logger.warning("Error stopping async database engine: %s", e)
+            finally:
+                self.async_db_engine = None
+
         if self.db_engine:
             try:
                 self.db_engine.stop()
             except Exception as e:
-                logger.warning(f"Error stopping database engine: {e}")
+                logger.warning("Error stopping database engine: %s", e)
             finally:
                 self.db_engine = None
                 self.orchestration = None
 
+    def __start_trigger_coalescer(self):
+        """Start the background thread that batches trigger_workflow calls"""
+        self._trigger_thread = threading.Thread(
+            target=self.__trigger_coalescer_loop,
+            name="TriggerCoalescerThread",
+            daemon=True
+        )
+        self._trigger_thread.start()
+        with self._trigger_lock:
+            self._trigger_accepting = True
+
+    def __stop_trigger_coalescer(self):
+        """Stop the trigger coalescer after draining queued triggers"""
+        if self._trigger_thread:
+            with self._trigger_lock:
+                self._trigger_accepting = False
+                self._trigger_queue.put(None)
+            self._trigger_thread.join(timeout=5)
+            self._trigger_thread = None
+
+    def __trigger_coalescer_loop(self):
+        # 1. İlk trigger'ı bekle, sonra pencere süresince gelenleri biriktir
+        stopping = False
+        while not stopping:
+            item = self._trigger_queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.TRIGGER_BATCH_WINDOW
+            while len(batch) < self.TRIGGER_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._trigger_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            # 2. Biriken trigger'ları tek transaction'da işle
+            self.__run_trigger_batch(batch)
+
+        # 3. Döngü bittikten sonra kuyrukta kalanları başarısız say (çağıranlar asılı kalmasın)
+        while True:
+            try:
+                item = self._trigger_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[1].set_exception(EngineError(
+                    "Trigger coalescer stopped",
+                    f"Workflow {item[0]} was not triggered"
+                ))
+
+    def __run_trigger_batch(self, batch: List[Tuple[str, Future]]):
+        outcomes = []
+        try:
+            with self._write_gate(), self.db_engine.get_session_context() as session:
+                for workflow_id, future in batch:
+                    try:
+                        # Her trigger kendi savepoint'inde: bir çağrının flush/IntegrityError hatası
+                        # sadece o savepoint'i geri alır, diğer çağrılar commit edilir
+                        with session.begin_nested():
+                            result = self.orchestration.trigger_workflow(session, workflow_id)
+                        outcomes.append((future, result, None))
+                    except Exception as e:
+                        outcomes.append((future, None, e))
+        except Exception as e:
+            # Commit/DB hatası -> batch'in tamamı başarısız
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        # Commit sonrası sonuçları dağıt ve input monitor'ü uyandır
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        self._input_event.set()
+
     def __start_parallelism_engine(self):
         """Start the parallelism engine for task execution"""
+        from .parallelism_engine import Manager
+
         try:
             self.execution_engine = Manager()
             self.execution_engine.start()
@@ -179,12 +446,14 @@ class MiniflowCore:
                 self.execution_engine.shutdown()
                 logger.info("Parallelism engine stopped successfully")
             except Exception as e:
-                logger.warning(f"Error stopping parallelism engine: {e}")
+                logger.warning("Error stopping parallelism engine: %s", e)
             finally:
                 self.execution_engine = None
 
     def __start_scheduler(self):
         """Start the input and output monitors"""
+        from .scheduler import MiniflowInputMonitor, MiniflowOutputMonitor
+
         try:
             # Validate dependencies
             if not self.db_engine or not self.orchestration:
@@ -198,9 +467,12 @@ class MiniflowCore:
                 database_engine=self.db_engine,
                 database_orchestration=self.orchestration,
                 execution_engine=self.execution_engine,
-                polling_interval=0.05,  # Faster polling for better responsiveness
                 batch_size=100,         # Larger batch size for concurrent workflows
-                worker_threads=8        # More worker threads for payload creation
+                worker_threads=8,       # More worker threads for payload creation
+                wakeup_event=self._input_event,
+                min_interval=0.005,     # Polling cadence while batches come back full
+                max_interval=0.5,       # Idle backstop - woken via _input_event on new tasks
+                busy_budget=8           # Max consecutive fast polls before backing off
             )
             self.input_monitor.start()
             
@@ -211,7 +483,8 @@ class MiniflowCore:
                 execution_engine=self.execution_engine,
                 polling_interval=0.5,
                 batch_size=50,
-                worker_threads=4
+                worker_threads=4,
+                input_wakeup_event=self._input_event
             )
             self.output_monitor.start()
             
@@ -226,284 +499,609 @@ class MiniflowCore:
             )
 
     def __stop_scheduler(self):
-        """Stop the input and output monitors"""
-        # Stop monitors
-        if self.input_monitor:
-            try:
-                self.input_monitor.stop()
-                logger.info("Input monitor stopped successfully")
-            except Exception as e:
-                logger.warning(f"Error stopping input monitor: {e}")
-            finally:
-                self.input_monitor = None
-        
-        if self.output_monitor:
-            try:
-                self.output_monitor.stop()
-                logger.info("Output monitor stopped successfully")
-            except Exception as e:
-                logger.warning(f"Error stopping output monitor: {e}")
-            finally:
-                self.output_monitor = None
+        """Stop the input and output monitors concurrently"""
+        monitors = {
+            "Input monitor": self.input_monitor,
+            "Output monitor": self.output_monitor,
+        }
+        monitors = {name: monitor for name, monitor in monitors.items() if monitor}
+
+        # Monitor'ler birbirinden bağımsız -> paralel durdur, toplam süre max(stop) olur
+        if monitors:
+            executor = ThreadPoolExecutor(max_workers=len(monitors), thread_name_prefix="SchedulerStop")
+            futures = {executor.submit(monitor.stop): name for name, monitor in monitors.items()}
+            done, not_done = wait(futures, timeout=self.SCHEDULER_STOP_TIMEOUT)
+
+            for future in done:
+                try:
+                    future.result()
+                    logger.info("%s stopped successfully", futures[future])
+                except Exception as e:
+                    logger.warning("Error stopping %s: %s", futures[future].lower(), e)
+
+            # Deadlock guard: takılan monitor'ü bekleme, uyar ve devam et
+            for future in not_done:
+                logger.warning("%s did not stop within %ss", futures[future], self.SCHEDULER_STOP_TIMEOUT)
+            executor.shutdown(wait=False)
+
+        self.input_monitor = None
+        self.output_monitor = None
+
+    # ENGINE ERİŞİMİ
+    # ===========================================================
+    def _require_engine(self) -> Tuple[DatabaseEngine, DatabaseOrchestration]:
+        """Engine başlatılmış mı kontrol et ve (db_engine, orchestration) çiftini döndür"""
+        engine = self.db_engine
+        ErrorManager.validate_engine_state(engine)
+        return engine, self.orchestration
+
+    @contextmanager
+    def _write_gate(self):
+        """Yazma admission control'ünü al; bu thread zaten tutuyorsa deadlock yerine hata ver"""
+        self._ensure_write_gate_free()
+        if not self._write_sem.acquire(timeout=self._write_gate_timeout):
+            raise ResourceError(
+                "Timed out waiting for a database write slot",
+                f"All write slots stayed busy for {self._write_gate_timeout}s; retry later"
+            )
+        self._write_gate_local.held = True
+        try:
+            yield
+        finally:
+            self._write_gate_local.held = False
+            self._write_sem.release()
+
+    def _ensure_write_gate_free(self) -> None:
+        if getattr(self._write_gate_local, 'held', False):
+            raise BusinessLogicError(
+                "Nested write operation while this thread holds the write gate",
+                "Inside 'with core.batch() as batch' use the batch handle methods (batch.trigger_workflow, ...)"
+            )
+
+    def _stream_in_batches(self, fetch_batch: Callable[..., Tuple[List[dict], Any]], batch_size: int) -> Iterator[dict]:
+        # Her batch kendi kısa read session'ında okunur ve session yield'lerden önce kapanır:
+        # yavaş bir stream client'ı connection'ı (SQLite'ta pool'daki tek connection) response boyunca tutmaz
+        engine, _ = self._require_engine()
+        cursor = None
+        while True:
+            with engine.get_read_session_context() as session:
+                rows, cursor = fetch_batch(session, cursor, batch_size)
+            yield from rows
+            if len(rows) < batch_size:
+                return
+
+    # BATCH (UNIT OF WORK)
+    # ===========================================================
+    @contextmanager
+    def batch(self):
+        """
+        Birden fazla yazma işlemini tek session ve tek commit ile çalıştırır
+
+        Example:
+            >>> with core.batch() as batch:
+            ...     batch.script_create({"name": "step"}, content)
+            ...     workflow = batch.workflow_create(workflow_data)
+            ...     batch.trigger_workflow(workflow["id"])
+        """
+        engine, _ = self._require_engine()
+
+        handle = None
+        try:
+            with self._write_gate(), engine.get_session_context() as session:
+                handle = MiniflowBatch(self, session)
+                yield handle
+                # Commit context çıkışında tek seferde yapılır
+        except Exception:
+            # Commit edilemeyen batch'in yazdığı script dosyalarını temizle
+            if handle is not None:
+                self._discard_script_files(handle._written_files)
+            raise
+
+        # Commit sonrası input monitor'ü uyandır
+        if handle._triggered:
+            self._input_event.set()
 
     # SCRIPT METOTLARI 
     # ===========================================================
     @ErrorManager.operation_context("script_creation")
     def script_create(self, script_data: dict, script_content: str) -> dict:
-        # Validate inputs
-        ErrorManager.validate_engine_state(self.db_engine)
+        engine, _ = self._require_engine()
+
+        # Veritabanı kaydı + dosya: commit başarısız olursa yazılan dosya silinir (yetim dosya kalmaz)
+        written_files = []
+        try:
+            with self._write_gate(), engine.get_session_context() as session:
+                result = self._do_script_create(session, script_data, script_content, written_files)
+                # Commit context çıkışında yapılır
+        except Exception:
+            self._discard_script_files(written_files)
+            raise
+
+        logger.info("Script created successfully: %s", script_data['name'])
+        return result
+
+    def _do_script_create(self, session, script_data: dict, script_content: str, written_files: list) -> dict:
+        # 1. Girdileri doğrula
         ErrorManager.validate_required_fields(script_data, ["name"], "script creation")
 
-        if not script_content or not script_content.strip():
+        if not script_content or script_content.isspace():
             raise ValidationError(
                 "Script content cannot be empty",
                 "Provide valid Python script content"
             )
-            
-        # 2. Dosya oluştur
-        absolute_path = create_script(
-            scripts_dir=self.scripts_dir,
-            script_name=script_data.get("name"),
-            script_extension="py",
-            script_content=script_content
-        )
 
-        # 3. Veritabanı için payload oluştur
+        # 2. Veritabanı için payload oluştur (dosya yolu önceden belirlenir)
         payload = {
             'name': script_data['name'],
             'description': script_data.get('description'),
             'language': 'PYTHON',  # ScriptType.PYTHON enum value
             'input_params': script_data.get('input_params', {}),
             'output_params': script_data.get('output_params', {}),
-            'script_path' : absolute_path
+            'script_path' : str(self.scripts_dir / f"{script_data['name']}.py")
         }
 
-        # 5. Veritabanı kaydı oluştur
-        with self.db_engine.get_session_context() as session:
-            result = self.orchestration.create_script(session, payload)
-            session.flush()
-            session.commit()
-            
-        # 6. Çıktıyı Döndür
-        logger.info(f"Script created successfully: {script_data['name']}")
+        # 3. Kayıt oluştur; dosya, DB doğrulamaları geçtikten sonra yazılır
+        result = self.orchestration.create_script(session, payload)
+        create_script(
+            scripts_dir=self.scripts_dir,
+            script_name=script_data["name"],
+            script_extension="py",
+            script_content=script_content,
+            sync=True
+        )
+        written_files.append(script_data["name"])
         return result
+
+    def _discard_script_files(self, script_names: list) -> None:
+        # Commit edilemeyen script'lerin dosyalarını sil
+        for script_name in script_names:
+            delete_script(self.scripts_dir, script_name)
         
+    @ErrorManager.operation_context("script_bulk_creation")
+    def script_create_many(self, items: List[Tuple[dict, str]]) -> List[dict]:
+        engine, orchestration = self._require_engine()
+        if not items:
+            return []
+
+        # 1. Tüm girdileri doğrula (dosya yazmadan önce)
+        for script_data, script_content in items:
+            ErrorManager.validate_required_fields(script_data, ["name"], "script creation")
+            if not script_content or script_content.isspace():
+                raise ValidationError(
+                    "Script content cannot be empty",
+                    f"Provide valid Python script content for '{script_data['name']}'"
+                )
+
+        # 2. Veritabanı için payload'ları oluştur (dosya yolları önceden belirlenir)
+        payloads = [{
+            'name': script_data['name'],
+            'description': script_data.get('description'),
+            'input_params': script_data.get('input_params', {}),
+            'output_params': script_data.get('output_params', {}),
+            'script_path': str(self.scripts_dir / f"{script_data['name']}.py")
+        } for script_data, _ in items]
+
+        def write_file(item):
+            create_script(
+                scripts_dir=self.scripts_dir,
+                script_name=item[0]["name"],
+                script_extension="py",
+                script_content=item[1],
+                sync=True
+            )
+            written_files.append(item[0]["name"])
+
+        # 3. Önce isim çakışması kontrolü + tek INSERT; dosyalar DB doğrulamaları geçtikten sonra
+        #    paralel yazılır (disk I/O GIL'i bırakır). Hata olursa sadece bu çağrının yazdığı dosyalar silinir
+        written_files = []
+        try:
+            with self._write_gate(), engine.get_session_context() as session:
+                result = orchestration.create_scripts_bulk(session, payloads)
+                with ThreadPoolExecutor(max_workers=min(32, len(items))) as executor:
+                    list(executor.map(write_file, items))
+                # Commit context çıkışında yapılır
+        except Exception:
+            self._discard_script_files(written_files)
+            raise
+
+        logger.info("%d scripts created successfully", len(result))
+        return result
+
     @ErrorManager.operation_context("script_deletion")
     def script_delete(self, script_id: str) -> dict:
         # 0. Temel Kontroller
-        ErrorManager.validate_engine_state(self.db_engine)
+        engine, orchestration = self._require_engine()
 
         if not script_id:
             raise ValidationError("Script ID is required", "Provide valid script ID")
         
-        with self.db_engine.get_session_context() as session:
-            result = self.orchestration.delete_script(session, script_id)
+        with self._write_gate(), engine.get_session_context() as session:
+            result = orchestration.delete_script(session, script_id)
 
         return result
 
     @ErrorManager.operation_context("script_listing")
     def script_list(self) -> dict:
         # 0. Temel Kontroller
-        ErrorManager.validate_engine_state(self.db_engine)
+        engine, orchestration = self._require_engine()
 
-        with self.db_engine.get_session_context() as session:
-            result =  self.orchestration.get_scripts(session)
+        with engine.get_read_session_context() as session:
+            result =  orchestration.get_scripts(session)
 
         return result
 
+    def script_list_stream(self, batch_size: int = 1000) -> Iterator[dict]:
+        # Generator: tüm katalog belleğe alınmadan batch_size'lık parçalar halinde yield edilir
+        _, orchestration = self._require_engine()
+        yield from self._stream_in_batches(orchestration.get_script_batch, batch_size)
+
     @ErrorManager.operation_context("script_retrieval")
     def script_get(self, script_id: str, include_content: bool = False) -> dict:
-        ErrorManager.validate_engine_state(self.db_engine)
+        engine, orchestration = self._require_engine()
         
         if not script_id:
             raise ValidationError("Script ID is required", "Provide valid script ID")
 
-        with self.db_engine.get_session_context() as session:
-            result =  self.orchestration.get_script(session, script_id, include_content)
+        with engine.get_read_session_context() as session:
+            result =  orchestration.get_script(session, script_id, include_content)
 
         return result
 
+    @ErrorManager.operation_context("script_retrieval")
+    def scripts_get_many(self, script_ids: List[str], include_content: bool = False) -> List[dict]:
+        """Fetch several scripts in one query; unknown ids are skipped, order follows script_ids"""
+        engine, orchestration = self._require_engine()
+
+        with engine.get_read_session_context() as session:
+            scripts = orchestration.get_scripts_by_ids(session, script_ids, include_content)
+
+        return [scripts[script_id] for script_id in script_ids if script_id in scripts]
+
     # WORKFLOW METOTLARI 
     # ===========================================================
     @ErrorManager.operation_context("workflow_creation")
-    def workflow_create(self, workflow_data: dict) -> dict:
-        ErrorManager.validate_engine_state(self.db_engine)
+    def workflow_create(self, workflow_data: dict, use_bulk_insert: Optional[bool] = None) -> dict:
+        engine, _ = self._require_engine()
+
+        with self._write_gate(), engine.get_session_context() as session:
+            result = self._do_workflow_create(session, workflow_data, use_bulk_insert)
+
+        logger.info("Workflow '%s' created successfully", workflow_data['name'])
+        return result
+
+    def _do_workflow_create(self, session, workflow_data: dict, use_bulk_insert: Optional[bool] = None) -> dict:
         ErrorManager.validate_required_fields(workflow_data, ["name", "nodes"], "workflow creation")
         # Ensure edges exist even if empty
         if "edges" not in workflow_data:
             workflow_data["edges"] = []
+        if not isinstance(workflow_data["nodes"], list) or not workflow_data["nodes"]:
+            raise ValidationError("Workflow must contain at least one node", "Provide a non-empty 'nodes' list")
+        if not isinstance(workflow_data["edges"], list):
+            raise ValidationError("Workflow edges must be a list", "Provide 'edges' as a list")
         
-        with self.db_engine.get_session_context() as session:
-            result = self.orchestration.create_workflow(session, workflow_data)
+        # Bulk path: node/edge/trigger kayıtları tablo başına tek INSERT ile yazılır
+        # use_bulk_insert verilmezse node sayısı eşiği aşan workflow'lar için otomatik seçilir
+        if use_bulk_insert is None:
+            use_bulk_insert = len(workflow_data["nodes"]) > self.BULK_INSERT_THRESHOLD
 
-        logger.info(f"Workflow '{workflow_data['name']}' created successfully")
-        return result
+        if use_bulk_insert:
+            return self.orchestration.create_workflow_bulk(session, workflow_data)
+        return self.orchestration.create_workflow(session, workflow_data)
 
     @ErrorManager.operation_context("workflow_deletion")
     def workflow_delete(self, workflow_id: str) -> dict:
-        ErrorManager.validate_engine_state(self.db_engine)
+        engine, _ = self._require_engine()
         
+        with self._write_gate(), engine.get_session_context() as session:
+            result = self._do_workflow_delete(session, workflow_id)
+
+        logger.info("Workflow %s deleted successfully", workflow_id)
+        return result
+
+    def _do_workflow_delete(self, session, workflow_id: str) -> dict:
         if not workflow_id:
             raise ValidationError("Workflow ID is required", "Provide valid workflow ID")
 
-        with self.db_engine.get_session_context() as session:
-            result = self.orchestration.delete_workflow(session, workflow_id)
-
-        logger.info(f"Workflow {workflow_id} deleted successfully")
-        return result
+        return self.orchestration.delete_workflow(session, workflow_id)
     
     @ErrorManager.operation_context("workflow_update")
     def workflow_update(self, workflow_id: str, workflow_data: dict) -> dict:
-        ErrorManager.validate_engine_state(self.db_engine)
+        engine, _ = self._require_engine()
         
+        with self._write_gate(), engine.get_session_context() as session:
+            result = self._do_workflow_update(session, workflow_id, workflow_data)
+
+        logger.info("Workflow %s updated successfully", workflow_id)
+        return result
+
+    def _do_workflow_update(self, session, workflow_id: str, workflow_data: dict) -> dict:
         if not workflow_id:
             raise ValidationError("Workflow ID is required", "Provide valid workflow ID")
 
-        with self.db_engine.get_session_context() as session:
-            result = self.orchestration.update_workflow(session, workflow_id, workflow_data)
-
-        logger.info(f"Workflow {workflow_id} updated successfully")
-        return result
+        return self.orchestration.update_workflow(session, workflow_id, workflow_data)
 
     @ErrorManager.operation_context("workflow_listing")
-    def workflow_list(self, page: Optional[int] = None, page_size: Optional[int] = None) -> dict:
-        ErrorManager.validate_engine_state(self.db_engine)
+    def workflow_list(self, page: Optional[int] = None, page_size: int = 100,
+                      after_id: Optional[str] = None) -> list:
+        # page deprecated: derin sayfalarda OFFSET yerine after_id (keyset) kullanın
+        engine, orchestration = self._require_engine()
+
+        with engine.get_read_session_context() as session:
+            return orchestration.get_workflows(session, page, page_size, after_id)
 
-        with self.db_engine.get_session_context() as session:
-            return self.orchestration.get_workflows(session, page, page_size)
+    def workflow_list_stream(self, batch_size: int = 100) -> Iterator[dict]:
+        # Generator: satırlar batch_size'lık parçalar halinde fetch edilip tek tek yield edilir
+        _, orchestration = self._require_engine()
+        yield from self._stream_in_batches(orchestration.get_workflow_batch, batch_size)
 
     @ErrorManager.operation_context("workflow_retrieval")
     def workflow_get(self, workflow_id: str) -> dict:
-        ErrorManager.validate_engine_state(self.db_engine)
+        engine, orchestration = self._require_engine()
         
         if not workflow_id:
             raise ValidationError("Workflow ID is required", "Provide valid workflow ID")
 
-        with self.db_engine.get_session_context() as session:
-            return self.orchestration.get_workflow(session, workflow_id)
+        with engine.get_read_session_context() as session:
+            return orchestration.get_workflow(session, workflow_id)
+
+    @ErrorManager.operation_context("workflow_retrieval")
+    def workflows_get_many(self, workflow_ids: List[str]) -> List[dict]:
+        """Fetch several workflows with nodes/edges/triggers in one round of queries"""
+        engine, orchestration = self._require_engine()
+
+        with engine.get_read_session_context() as session:
+            workflows = orchestration.get_workflows_by_ids(session, workflow_ids)
+
+        return [workflows[workflow_id] for workflow_id in workflow_ids if workflow_id in workflows]
     
     # EXECUTION METOTLARI 
     # ===========================================================
     @ErrorManager.operation_context("trigger_workflow")
     def trigger_workflow(self, workflow_id: str) -> dict:
-        ErrorManager.validate_engine_state(self.db_engine)
+        engine, _ = self._require_engine()
         
         if not workflow_id:
             raise ValidationError("Workflow ID is required", "Provide valid workflow ID")
-    
-        with self.db_engine.get_session_context() as session:
-            result = self.orchestration.trigger_workflow(session, workflow_id)
+
+        # Coalescer thread'i de aynı gate'i bekler: batch içinden çağrı sonsuza kadar bloklanmasın
+        self._ensure_write_gate_free()
+
+        future = None
+        with self._trigger_lock:
+            if self._trigger_accepting:
+                # Coalescer üzerinden: aynı pencerede gelen trigger'larla birlikte commit edilir
+                future = Future()
+                self._trigger_queue.put((workflow_id, future))
+
+        if future is not None:
+            try:
+                result = future.result(timeout=self.TRIGGER_RESULT_TIMEOUT)
+            except FutureTimeoutError:
+                raise EngineError(
+                    "Timed out waiting for the trigger coalescer",
+                    f"No result for workflow {workflow_id} within {self.TRIGGER_RESULT_TIMEOUT}s"
+                ) from None
+        else:
+            with self._write_gate(), engine.get_session_context() as session:
+                result = self._do_trigger_workflow(session, workflow_id)
+
+            # Commit sonrası input monitor'ü uyandır
+            self._input_event.set()
         
-        logger.info(f"Workflow {workflow_id} triggered successfully")
+        logger.info("Workflow %s triggered successfully", workflow_id)
         return result
+
+    def _do_trigger_workflow(self, session, workflow_id: str) -> dict:
+        if not workflow_id:
+            raise ValidationError("Workflow ID is required", "Provide valid workflow ID")
+
+        return self.orchestration.trigger_workflow(session, workflow_id)
     
     @ErrorManager.operation_context("execution_cancellation")
     def cancel_execution(self, execution_id: str) -> dict:
-        ErrorManager.validate_engine_state(self.db_engine)
+        engine, _ = self._require_engine()
         
-        if not execution_id:
-            raise ValidationError("Execution ID is required", "Provide valid execution ID")
+        with self._write_gate(), engine.get_session_context() as session:
+            result = self._do_cancel_execution(session, execution_id)
         
-        with self.db_engine.get_session_context() as session:
-            result = self.orchestration.cancel_execution(session, execution_id)
-        
-        logger.info(f"Execution {execution_id} cancelled successfully")
+        logger.info("Execution %s cancelled successfully", execution_id)
         return result
+
+    def _do_cancel_execution(self, session, execution_id: str) -> dict:
+        if not execution_id:
+            raise ValidationError("Execution ID is required", "Provide valid execution ID")
+
+        return self.orchestration.cancel_execution(session, execution_id)
     
     @ErrorManager.operation_context("execution_retrieval")
     def execution_get(self, execution_id: str) -> dict:
-        ErrorManager.validate_engine_state(self.db_engine)
+        engine, orchestration = self._require_engine()
         
         if not execution_id:
             raise ValidationError("Execution ID is required", "Provide valid execution ID")
         
-        with self.db_engine.get_session_context() as session:
-            result = self.orchestration.get_execution(session, execution_id)
+        with engine.get_read_session_context() as session:
+            result = orchestration.get_execution(session, execution_id)
         
-        logger.info(f"Execution {execution_id} retrieved successfully")
+        logger.info("Execution %s retrieved successfully", execution_id)
         return result
 
     @ErrorManager.operation_context("execution_listing")
-    def execution_list(self, page: Optional[int] = None, page_size: Optional[int] = None) -> dict:
-        ErrorManager.validate_engine_state(self.db_engine)
+    def execution_list(self, page: Optional[int] = None, page_size: int = 100,
+                       after_id: Optional[str] = None) -> list:
+        # page deprecated: derin sayfalarda OFFSET yerine after_id (keyset) kullanın
+        engine, orchestration = self._require_engine()
         
-        with self.db_engine.get_session_context() as session:
-            result =  self.orchestration.get_executions(session, page, page_size)
+        with engine.get_read_session_context() as session:
+            result =  orchestration.get_executions(session, page, page_size, after_id)
         
-        logger.info(f"Executions listed successfully")
+        logger.info("Executions listed successfully")
         return result
 
+    def execution_list_stream(self, batch_size: int = 100) -> Iterator[dict]:
+        # Generator: satırlar batch_size'lık parçalar halinde fetch edilip tek tek yield edilir
+        _, orchestration = self._require_engine()
+        yield from self._stream_in_batches(orchestration.get_execution_batch, batch_size)
+
     @ErrorManager.operation_context("execution_listing_by_workflow")
     def execution_list_by_workflow(self, workflow_id: str, page: Optional[int] = None, page_size: Optional[int] = None) -> list:
         """Get all executions for a specific workflow"""
-        ErrorManager.validate_engine_state(self.db_engine)
+        engine, orchestration = self._require_engine()
         
         if not workflow_id:
             raise ValidationError("Workflow ID is required", "Provide valid workflow ID")
         
-        with self.db_engine.get_session_context() as session:
-            executions = self.orchestration.execution_crud.get_executions_by_workflow(session, workflow_id)
-            
-            # Convert to list of dictionaries with consistent field names
-            result = []
-            for execution in executions:
-                exec_dict = {
-                    'execution_id': execution.id,  # Use execution_id for consistency
-                    'workflow_id': execution.workflow_id,
-                    'status': execution.status.value if hasattr(execution.status, 'value') else execution.status,
-                    'started_at': execution.started_at.isoformat() if execution.started_at else None,
-                    'ended_at': execution.ended_at.isoformat() if execution.ended_at else None,
-                    'created_at': execution.created_at.isoformat() if execution.created_at else None,
-                    'updated_at': execution.updated_at.isoformat() if execution.updated_at else None
-                }
-                result.append(exec_dict)
+        with engine.get_read_session_context() as session:
+            rows = orchestration.execution_crud.get_executions_by_workflow_projected(session, workflow_id)
+
+        # Session kapandıktan sonra formatla -> connection CPU işi süresince tutulmaz
+        # Convert to list of dictionaries with consistent field names (execution_id for consistency)
+        iso = _isoformat_or_none
+        result = [
+            {
+                'execution_id': execution_id,
+                'workflow_id': row_workflow_id,
+                'status': getattr(status, 'value', status),
+                'started_at': iso(started_at),
+                'ended_at': iso(ended_at),
+                'created_at': iso(created_at),
+                'updated_at': iso(updated_at),
+            }
+            for execution_id, row_workflow_id, status, started_at, ended_at, created_at, updated_at in rows
+        ]
         
-        logger.info(f"Retrieved {len(result)} executions for workflow {workflow_id}")
+        logger.info("Retrieved %d executions for workflow %s", len(result), workflow_id)
         return result
 
+    # ASYNC OKUMA METOTLARI
+    # ===========================================================
+    async def _run_read_async(self, query: Callable[..., Any], *args) -> Any:
+        # AsyncSession varsa event loop'u bloklamadan run_sync ile, yoksa read session'ı worker thread'de çalıştır
+        engine, _ = self._require_engine()
+        if self.async_db_engine is not None:
+            return await self.async_db_engine.run_read(query, *args)
+
+        def run():
+            with engine.get_read_session_context() as session:
+                return query(session, *args)
+        return await asyncio.to_thread(run)
+
+    @ErrorManager.operation_context("script_listing")
+    async def script_list_async(self) -> list:
+        _, orchestration = self._require_engine()
+        return await self._run_read_async(orchestration.get_scripts)
+
+    @ErrorManager.operation_context("script_retrieval")
+    async def script_get_async(self, script_id: str, include_content: bool = False) -> dict:
+        _, orchestration = self._require_engine()
+
+        if not script_id:
+            raise ValidationError("Script ID is required", "Provide valid script ID")
+
+        if include_content:
+            return await self._run_read_async(orchestration.get_script, script_id, include_content)
+        return await self._script_loader.load(script_id)
+
+    @ErrorManager.operation_context("workflow_listing")
+    async def workflow_list_async(self, page: Optional[int] = None, page_size: int = 100,
+                                  after_id: Optional[str] = None) -> list:
+        _, orchestration = self._require_engine()
+        return await self._run_read_async(orchestration.get_workflows, page, page_size, after_id)
+
+    @ErrorManager.operation_context("workflow_retrieval")
+    async def workflow_get_async(self, workflow_id: str) -> dict:
+        self._require_engine()
+
+        if not workflow_id:
+            raise ValidationError("Workflow ID is required", "Provide valid workflow ID")
+
+        return await self._workflow_loader.load(workflow_id)
+
+    async def __load_scripts(self, script_ids: List[str]) -> Dict[str, dict]:
+        _, orchestration = self._require_engine()
+        return await self._run_read_async(orchestration.get_scripts_by_ids, script_ids)
+
+    async def __load_workflows(self, workflow_ids: List[str]) -> Dict[str, dict]:
+        _, orchestration = self._require_engine()
+        return await self._run_read_async(orchestration.get_workflows_by_ids, workflow_ids)
+
     # HEALTH CHECK METHOD
     # ===========================================================
     def health_check(self) -> dict:
         """
         System health check - returns status of all components
+
+        Result is cached briefly (~500ms) while component states are unchanged.
         """
         try:
+            # Bileşen durumları tek seferde hesaplanır
+            db_ok = bool(self.db_engine and self.db_engine.is_alive)
+            engine_ok = bool(self.execution_engine and self.execution_engine.started)
+            input_ok = bool(self.input_monitor and self.input_monitor.is_running())
+            output_ok = bool(self.output_monitor and self.output_monitor.is_running())
+
             components = {
                 "database": {
-                    "status": "healthy" if self.db_engine and self.db_engine.is_alive else "unhealthy",
-                    "details": "Database engine running" if self.db_engine and self.db_engine.is_alive else "Database engine not running"
+                    "status": "healthy" if db_ok else "unhealthy",
+                    "details": "Database engine running" if db_ok else "Database engine not running"
                 },
                 "parallelism_engine": {
-                    "status": "healthy" if self.execution_engine and self.execution_engine.started else "unhealthy", 
-                    "details": "Execution engine running" if self.execution_engine and self.execution_engine.started else "Execution engine not running"
+                    "status": "healthy" if engine_ok else "unhealthy",
+                    "details": "Execution engine running" if engine_ok else "Execution engine not running"
                 },
                 "scheduler": {
-                    "input_monitor": "healthy" if self.input_monitor and self.input_monitor.is_running() else "unhealthy",
-                    "output_monitor": "healthy" if self.output_monitor and self.output_monitor.is_running() else "unhealthy"
+                    "input_monitor": "healthy" if input_ok else "unhealthy",
+                    "output_monitor": "healthy" if output_ok else "unhealthy"
                 }
             }
             
             # Overall status
-            all_healthy = (
-                components["database"]["status"] == "healthy" and
-                components["parallelism_engine"]["status"] == "healthy" and
-                (not self.enable_scheduler or (
-                    components["scheduler"]["input_monitor"] == "healthy" and
-                    components["scheduler"]["output_monitor"] == "healthy"
-                ))
-            )
-            
-            return {
-                "status": "healthy" if all_healthy else "unhealthy",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "components": components,
-                "ready_tasks": self._get_ready_task_count() if all_healthy else -1
-            }
+            all_healthy = db_ok and engine_ok and (not self.enable_scheduler or (input_ok and output_ok))
+
+            # Cache: bileşen durumları ve engine aynıysa TTL süresince DB sorgusu yapma.
+            # Lock sadece cache okuma/yazmayı korur; ping/COUNT lock dışında çalışır (yavaş DB diğer probe'ları bloklamaz).
+            # Yenileme sürerken gelen probe'lar aynı bileşen durumundaki son sonucu alır (probe patlamasında COUNT tekrarlanmaz).
+            # Çağıran dönen dict'i değiştirebilir -> her zaman kopya döndürülür.
+            cache_key = (id(self.db_engine), db_ok, engine_ok, input_ok, output_ok)
+            with self._health_check_lock:
+                if self._last_health_check is not None and self._last_health_check_key == cache_key:
+                    fresh = time.monotonic() - self._last_health_check_at < self._health_check_ttl
+                    if fresh or self._health_check_refreshing:
+                        return copy.deepcopy(self._last_health_check)
+                self._health_check_refreshing = True
+
+            try:
+                # Cache miss: database'e gerçekten ulaşılabildiğini doğrula
+                if all_healthy and not self.db_engine.ping():
+                    components["database"] = {
+                        "status": "unhealthy",
+                        "details": "Database ping failed"
+                    }
+                    all_healthy = False
+
+                if all_healthy:
+                    components["database"]["pool"] = self.db_engine.get_engine.pool.status()
+
+                result = {
+                    "status": "healthy" if all_healthy else "unhealthy",
+                    "timestamp": _iso_now(),
+                    "components": components,
+                    "ready_tasks": self._get_ready_task_count() if all_healthy else -1
+                }
+
+                with self._health_check_lock:
+                    self._last_health_check = copy.deepcopy(result)
+                    self._last_health_check_key = cache_key
+                    self._last_health_check_at = time.monotonic()
+                return result
+            finally:
+                with self._health_check_lock:
+                    self._health_check_refreshing = False
             
         except Exception as e:
             return {
                 "status": "error",
-                "timestamp": datetime.utcnow().isoformat() + "Z", 
+                "timestamp": _iso_now(), 
                 "error": str(e),
                 "components": {}
             }
@@ -517,22 +1115,29 @@ class MiniflowCore:
             import uvicorn
             from .api import app
             
-            logger.info(f"Starting Miniflow API Server at {host}:{port}")
-            logger.info(f"API Documentation available at: http://{host}:{port}/docs")
-            logger.info(f"Health Check available at: http://{host}:{port}/health")
+            logger.info("Starting Miniflow API Server at %s:%s", host, port)
+            logger.info("API Documentation available at: http://%s:%s/docs", host, port)
+            logger.info("Health Check available at: http://%s:%s/health", host, port)
             
             if self.enable_scheduler:
                 logger.info("Scheduler is enabled - workflows will be automatically executed")
             else:
                 logger.info("Scheduler is disabled - workflows must be executed manually")
             
-            uvicorn.run(
-                app,
-                host=host,
-                port=port,
-                reload=reload,
-                log_level="info"
-            )
+            # uvicorn SIGINT/SIGTERM'i kendisi yakalayıp run()'dan döner; yine de süreç
+            # beklenmedik şekilde kapanırsa monitor/engine'ler atexit ile durdurulur
+            atexit.register(self.stop)
+            try:
+                uvicorn.run(
+                    app,
+                    host=host,
+                    port=port,
+                    reload=reload,
+                    log_level="info"
+                )
+            finally:
+                self.stop()
+                atexit.unregister(self.stop)
             
         except ImportError as e:
             raise ResourceError(
@@ -598,8 +1203,11 @@ class MiniflowCore:
     
     def _get_ready_task_count(self) -> int:
         """Helper method to get count of ready tasks"""
+        # Scheduler çalışıyorsa input monitor'ün tuttuğu sayaç kullanılır (DB sorgusu yok)
+        if self.input_monitor and self.input_monitor.is_running():
+            return self.input_monitor.ready_count()
         try:
-            with self.db_engine.get_session_context() as session:
+            with self.db_engine.get_read_session_context() as session:
                 return self.orchestration.execution_input_crud.count_ready_tasks(session)
         except:
             return -1
\ No newline at end of file
@@ -1,30 +1,99 @@
+import asyncio
+import heapq
 import json
+import logging
+import math
+import os
+import pickle
 import threading
 import time
-from multiprocessing import cpu_count, Pipe
+from collections import deque
+from multiprocessing import cpu_count, Pipe, Queue
 from threading import Thread
 from ..process import BaseProcess
+from ..process.base_process import SHUTDOWN_COMMAND, RUN_PYTHON_BATCH, MAX_WORKER_THREADS
 from ..queue_module import BaseQueue
+from ..queue_module.base_queue import async_queue_get
 import psutil
 
+logger = logging.getLogger(__name__)
+
+
+def _effective_cpu_count():
+    """
+    Process'in gerçekten kullanabileceği CPU sayısı.
+    cpu_count() host'taki tüm çekirdekleri döndürür; container'da affinity ve
+    cgroup v2 CPU kotası (cpu.max) dikkate alınmazsa worker sayısı şişer.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Linux dışı platformlar
+        cpus = cpu_count()
+
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+
+    return cpus
+
+
+def _error_backoff(errors: int) -> float:
+    """Ardışık hata sayısına göre üstel bekleme (10ms'den başlar, en fazla 1s)"""
+    return min(1.0, 0.01 * 2 ** min(errors, 7))
+
+
+def _available_cores():
+    """Process'in çalışabileceği çekirdek id'leri (affinity maskesi; Linux dışında tüm çekirdekler)"""
+    try:
+        return sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        return list(range(cpu_count()))
+
 
 class QueueWatcher:
-    def __init__(self, input_queue: BaseQueue, output_queue: BaseQueue, os: bool):
+    def __init__(self, input_queue: BaseQueue, output_queue: BaseQueue, os: bool, pin_cpus: bool = True):
         self.input_queue = input_queue
         self.output_queue = output_queue
-        self.max_cpu_count = cpu_count() - 1
+        self.max_cpu_count = _effective_cpu_count() - 1
         self.min_process_count = 2
         self.thread_lock_limit = self.max_cpu_count * 3
         self.active_processes = []
+        # active_processes ile paralel diziler: scaler taramaları dict lookup yapmadan düz liste okur
+        self._pids = []
+        self._thread_counters = []
+        # Okuyucular için immutable (pids, counters) snapshot'ı; sadece yazanlar process_lock alır,
+        # yeni tuple tek attribute atamasıyla yayınlanır
+        self._snapshot = ((), ())
+        # Standby pool: önceden fork edilmiş, dispatch almayan process'ler. Scale-up fork beklemeden
+        # buradan alır; scale-down'da durdurulan process önce buraya döner
+        self._standby = deque()
+        self.standby_size = 2
         self.started = False
-        self.scaler_thread = None
+        self.watch_thread = None             # Input/thread-count/scaler coroutine'lerini çalıştıran tek event loop thread'i
+        self._watch_loop = None
+        self._watch_stop = None              # asyncio.Event, watch loop içinde oluşturulur
+        self._scale_signal = None            # asyncio.Event: dispatch yük eşiğini aşınca scaler'ı uyandırır
+        self.scale_up_threshold = 1.5        # Process başına ortalama thread sayısı
+        self.scale_idle_interval = 5.0       # Sinyal gelmezse periyodik kontrol (scale-down, reconcile) aralığı
+        self.scale_cooldown = 0.5            # Bir scale adımından sonra yeni process'in yükü alması için bekleme
         self.thread_count_list = []
-        self.process_index = 0
+        self.thread_count_updates = Queue()  # Process'lerden (pid, thread_count) bildirimleri
+        self.thread_count_by_pid = {}
+        self._load_heap = []                 # (thread_count, pid) min-heap, lazy deletion
+        self._process_by_pid = {}
+        self._load_lock = threading.Lock()
+        self.dispatch_batch_size = 64        # _watch_input tek turda kuyruktan en fazla bu kadar item çeker
         self.shutdown_event = threading.Event()
         self.process_lock = threading.Lock()
-        self.current_process_index = 0  # Round-robin selection
+        self.pin_cpus = pin_cpus             # Her worker ayrı bir çekirdeğe sabitlenir (round-robin)
+        self._cores = _available_cores()
+        self._next_core = 0
         self.priority = -19 if os else psutil.HIGH_PRIORITY_CLASS  # self._unix_process_classes() if os else self._nt_process_classes()
-        print(f"QueueWatcher started with priority {self.priority}")
+        logger.info("QueueWatcher started with priority %s", self.priority)
 
     def start(self):
         """Sadece bir kez başlatılabilir"""
@@ -33,178 +102,455 @@ class QueueWatcher:
 
         self.started = True
         self._start_processes(self.min_process_count)  # Sadece burada başlat
-        self._start_watch_threads(self._watch_input)
+        self._refill_standby()
+        self._start_watch_loop()
 
-    def _watch_input(self):
-        """Input Queue tracker - optimized for batch processing"""
-        while not self.shutdown_event.is_set():
+    def _start_watch_loop(self):
+        self.watch_thread = Thread(target=asyncio.run, args=(self._watch_main(),), daemon=True)
+        self.watch_thread.start()
+
+    async def _watch_main(self):
+        """Input, thread count ve scaler döngülerini tek event loop'ta çalıştır"""
+        self._watch_stop = asyncio.Event()
+        self._scale_signal = asyncio.Event()
+        self._watch_loop = asyncio.get_running_loop()
+        # shutdown() loop hazır olmadan çağrıldıysa hemen çık
+        if self.shutdown_event.is_set():
+            return
+
+        # start() sırasında başlatılan process'lerin çıkışlarını izlemeye başla
+        for proc_dict in self.active_processes:
+            self._watch_exit(proc_dict)
+
+        tasks = [
+            asyncio.create_task(self._watch_input()),
+            asyncio.create_task(self._watch_thread_counts()),
+            asyncio.create_task(self._auto_scale_processes()),
+        ]
+        try:
+            await self._watch_stop.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _watch_input(self):
+        """Input Queue tracker - item gelene kadar askıda, gelenleri batch halinde dağıtır"""
+        # Döngüde değişmeyen attribute'lar bir kez local'e bağlanır
+        get_async = self.input_queue.get_async
+        get_many = self.input_queue.get_many
+        dispatch = self._dispatch_items
+        batch_rest = self.dispatch_batch_size - 1
+        errors = 0
+        while True:
             try:
-                # Process multiple items in quick succession for better concurrency
-                items_processed = 0
-                max_batch_size = 20
-                
-                while items_processed < max_batch_size and not self.shutdown_event.is_set():
-                    # Non-blocking get with shorter timeout for responsiveness
-                    item = self.input_queue.get_with_timeout(timeout=0.1)
-                    if item is not None:
-                        with self.process_lock:  # Thread-safe process assignment
-                            if len(self.active_processes) > 0:
-                                self._create_thread(item)
-                                items_processed += 1
-                            else:
-                                # Re-queue item if no processes available
-                                self.input_queue.put(item)
-                                break
-                    else:
-                        # No more items available, break batch processing
-                        break
-                
-                # Small sleep only if no items were processed
-                if items_processed == 0:
-                    time.sleep(0.1)
+                # İlk item'ı bekle, ardından kuyrukta hazır olanları tek lock alımıyla topla
+                items = [await get_async()]
+                items.extend(get_many(batch_rest))
+
+                if dispatch(items):
+                    # Uygun process yok, item'lar geri kuyruğa alındı (aynı item'lar üzerinde busy-loop olmasın)
+                    await asyncio.sleep(0.1)
+                else:
+                    # Kuyruk doluyken get_async askıya girmez; diğer coroutine'lere sıra ver
+                    await asyncio.sleep(0)
+                errors = 0
+
+            except Exception as e:
+                errors += 1
+                logger.error("Input watcher error: %s", e)
+                await asyncio.sleep(_error_backoff(errors))
 
+    async def _watch_thread_counts(self):
+        """Process'lerin push ettiği thread sayısı bildirimlerini topla (event-driven)"""
+        errors = 0
+        while True:
+            try:
+                pid, thread_count = await async_queue_get(self.thread_count_updates)
             except Exception as e:
-                print(f"Input watcher error: {e}")
-                time.sleep(0.1)
+                errors += 1
+                logger.error("Thread count watcher error: %s", e)
+                await asyncio.sleep(_error_backoff(errors))
+                continue
+            errors = 0
+            self._set_thread_count(pid, thread_count)
+
+    def _set_thread_count(self, pid, thread_count):
+        """Thread sayısını güncelle ve heap'e yeni girişi ekle (eski giriş lazy olarak atlanır)"""
+        with self._load_lock:
+            # Değişmeyen sayı için yeni giriş eklenmez (heap'te geçerli giriş zaten var)
+            if pid not in self._process_by_pid or self.thread_count_by_pid.get(pid) == thread_count:
+                return
+            self.thread_count_by_pid[pid] = thread_count
+            self._push_load_locked(thread_count, pid)
+
+    def _push_load_locked(self, thread_count, pid):
+        """Heap'e giriş ekle; stale girişler birikirse heap'i gerçek sayılardan yeniden kur"""
+        heapq.heappush(self._load_heap, (thread_count, pid))
+        if len(self._load_heap) > 4 * max(1, len(self._process_by_pid)):
+            self._rebuild_load_heap_locked()
+
+    def _rebuild_load_heap_locked(self):
+        """Heap'i thread_count_by_pid'den sıfırdan kur (stale girişleri at); çağıran _load_lock'u tutmalı"""
+        self._load_heap = [(thread_count, pid) for pid, thread_count in self.thread_count_by_pid.items()
+                           if pid in self._process_by_pid]
+        heapq.heapify(self._load_heap)
 
     def _get_process_thread_counts(self):
-        thread_counts = []
-        with self.process_lock:
-            for proc_dict in self.active_processes:
-                try:
-                    proc_dict['health_pipe'].send({"command": "get_thread_count"})
-                    if proc_dict['health_pipe'].poll():  # 1 sn timeout
-                        resp = proc_dict['health_pipe'].recv()
-                        thread_counts.append(resp.get("thread_count", 0))
-                    else:
-                        thread_counts.append(None)
-                except Exception as e:
-                    print(f"Error getting thread count: {e}")
-                    thread_counts.append(None)
-        return thread_counts
-
-    def _get_next_process(self):
-        """Select the process with the lowest thread count"""
-        if not self.active_processes or None in self.thread_count_list:
-            return None
+        """Process'lerin paylaşılan bellekteki thread sayılarını active_processes sırasında döndür (IPC yok)"""
+        _, counters = self._snapshot
+        return [counter.value for counter in counters]
+
+    def _reconcile_thread_counts(self):
+        """
+        Heap'i paylaşılan bellekteki gerçek sayılarla eşitle.
+        Kaybolan push bildirimlerini ve dispatch sırasındaki iyimser artışları düzeltir.
+        """
+        pids, counters = self._snapshot
+        with self._load_lock:
+            for pid, counter in zip(pids, counters):
+                if pid in self._process_by_pid:
+                    self.thread_count_by_pid[pid] = counter.value
+            # Periyodik kontrolde heap gerçek sayılardan yeniden kurulur (stale girişler birikmez)
+            self._rebuild_load_heap_locked()
 
-        max_thread = 10  # Increased from 3 to 10 for better concurrency
+    def _peek_load_locked(self):
+        """Heap tepesindeki stale girişleri at, en az yüklü (thread_count, pid) girişini döndür"""
+        while self._load_heap:
+            thread_count, pid = self._load_heap[0]
+            # Stale giriş: process durdurulmuş veya sayısı değişmiş
+            if pid in self._process_by_pid and self.thread_count_by_pid.get(pid) == thread_count:
+                return thread_count, pid
+            heapq.heappop(self._load_heap)
+        return None
 
-        thread_count_list = self.thread_count_list
-        selected_process = None
+    def _assign_locked(self, count: int):
+        """
+        count item'ı en az yüklü process'lerden başlayarak dağıt; [(process, item_sayısı), ...] döndürür.
+        Her adımda seçilen process bir sonraki process'in seviyesine kadar doldurulur, böylece
+        heap işlemi item başına değil seviye değişimi başına yapılır. Çağıran _load_lock'u tutmalı.
+        """
+        max_thread = MAX_WORKER_THREADS  # Process'in thread pool boyutu
+        assigned = {}
+        remaining = count
 
-        """if sum(thread_count_list) >= max_thread * self.max_cpu_count:
-            selected_process = self.active_processes[self.process_index]
-            self.process_index = (self.process_index + 1) % self.max_cpu_count
+        while remaining:
+            entry = self._peek_load_locked()
+            # En az yüklü process bile doluysa seçim yok (kalan item'lar geri kuyruğa alınır)
+            if entry is None or entry[0] >= max_thread:
+                break
+            thread_count, pid = entry
+            heapq.heappop(self._load_heap)
 
-        else:
-            for thread_count in thread_count_list:
-                if thread_count < max_thread:
-                    print("[PROCESS SELECTION] Select process with thread count", thread_count, max_thread)
-                    index = thread_count_list.index(thread_count)
-                    selected_process = self.active_processes[index]
-                    self.process_index = index"""
+            # Bir sonraki en az yüklü process'in bir üstüne (veya max_thread'e) kadar doldur
+            ceiling = max_thread
+            next_entry = self._peek_load_locked()
+            if next_entry is not None:
+                ceiling = min(ceiling, next_entry[0] + 1)
+            take = min(remaining, ceiling - thread_count)
 
-        for thread_count in thread_count_list:
-            if thread_count < max_thread:
-                print("[PROCESS SELECTION] Select process with thread count", thread_count, max_thread)
-                index = thread_count_list.index(thread_count)
-                selected_process = self.active_processes[index]
-                self.process_index = index
+            # İyimser artış: process kendi sayısını push edene kadar aynı process'e yığılmayı önler
+            self.thread_count_by_pid[pid] = thread_count + take
+            self._push_load_locked(thread_count + take, pid)
+            assigned[pid] = assigned.get(pid, 0) + take
+            remaining -= take
 
-        """if selected_process is None and sum(thread_count_list) < max_thread * self.max_cpu_count:
-            self._start_processes(1)"""
+        return [(self._process_by_pid[pid], taken) for pid, taken in assigned.items()]
 
-        return selected_process
+    def _publish_snapshot(self):
+        """process_lock altında çağrılır: okuyucuların kullandığı snapshot'ı yenile"""
+        self._snapshot = (tuple(self._pids), tuple(self._thread_counters))
+
+    def _spawn_process(self):
+        """Yeni process fork et (henüz dispatch almaz)"""
+        # Tek yönlü pipe'lar: process'ler cevapları paylaşılan thread_count_updates kuyruğuna yazar
+        cmd_child_conn, cmd_parent_conn = Pipe(duplex=False)
+        health_child_conn, health_parent_conn = Pipe(duplex=False)
+        process = BaseProcess(cmd_child_conn, health_child_conn, self.output_queue, self.thread_count_updates,
+                              parent_conns=(cmd_parent_conn, health_parent_conn))
+        process.start()
+        # Okuma uçları artık child'da; parent'taki kopyalar kapatılır (sonraki fork'lara da miras kalmaz)
+        cmd_child_conn.close()
+        health_child_conn.close()
+        # psutil handle process ile birlikte saklanır; priority işlemleri /proc'u yeniden açmaz
+        ps_process = self._get_ps_process(process.process.pid)
+        if ps_process is not None:
+            self._set_process_priority(ps_process, self.priority)
+        if self.pin_cpus:
+            self._pin_process(process.process.pid, ps_process)
+        logger.debug("[QUEUEWATCHER] Starting process %s", process.process.pid)
+        return {
+            'process': process,
+            'cmd_pipe': cmd_parent_conn,
+            'health_pipe': health_parent_conn,
+            'ps_process': ps_process,
+        }
+
+    def _take_standby(self):
+        """Canlı bir standby process döndür, yoksa None"""
+        while self._standby:
+            proc_dict = self._standby.popleft()
+            if proc_dict['process'].process.is_alive():
+                return proc_dict
+            self._terminate_process(proc_dict)
+        return None
+
+    def _refill_standby(self):
+        """Standby pool'u hedef boyuta getir; fazlasını kapat"""
+        target = max(0, min(self.standby_size, self.max_cpu_count - len(self.active_processes)))
+        while len(self._standby) > target:
+            self._terminate_process(self._standby.pop())
+        while len(self._standby) < target:
+            self._standby.append(self._spawn_process())
 
     def _start_processes(self, count):
         for _ in range(count):
-            cmd_parent_conn, cmd_child_conn = Pipe()
-            health_parent_conn, health_child_conn = Pipe()
-            process = BaseProcess(cmd_child_conn, health_child_conn, self.output_queue)
-            process.start()
-            self._set_process_priority(process.process.pid, self.priority)
-            print(f"[QUEUEWATCHER] Starting process {process.process.pid}")
-            self.active_processes.append({
-                'process': process,
-                'cmd_pipe': cmd_parent_conn,
-                'health_pipe': health_parent_conn,
-            })
+            proc_dict = self._take_standby() or self._spawn_process()
+            process = proc_dict['process']
+            with self.process_lock:
+                self.active_processes.append(proc_dict)
+                self._pids.append(process.process.pid)
+                self._thread_counters.append(process.thread_count)
+                self._publish_snapshot()
+            with self._load_lock:
+                self._process_by_pid[process.process.pid] = proc_dict
+            self._watch_exit(proc_dict)
+            # Standby'dan gelen process'te önceki işlerin thread'leri hâlâ çalışıyor olabilir
+            self._set_thread_count(process.process.pid, process.thread_count.value)
 
     def _stop_processes(self, count):
+        # Lock altında sadece listeler güncellenir; pipe/terminate/join syscall'ları lock dışında
         with self.process_lock:
+            stopped = []
             for _ in range(min(count, len(self.active_processes) - self.min_process_count)):
-                p = self.active_processes.pop()
-                try:
-                    p['cmd_pipe'].send({'command': 'shutdown'})
-                    p['process'].shutdown()
-                except Exception as e:
-                    print(f"Error shutting down process: {e}")
-
-    def _create_thread(self, item: json):
-        process = self._get_next_process()
-        if process is None:
-            """item["error_message"] = {"error": "No active processes available"}
-            self.output_queue.put(item)"""
-            self.input_queue.put(item)
+                stopped.append(self.active_processes.pop())
+                self._pids.pop()
+                self._thread_counters.pop()
+            if stopped:
+                self._publish_snapshot()
+
+        with self._load_lock:
+            for p in stopped:
+                self._process_by_pid.pop(p['process'].process.pid, None)
+                self.thread_count_by_pid.pop(p['process'].process.pid, None)
+            if stopped:
+                self._rebuild_load_heap_locked()
+
+        to_terminate = []
+        for p in stopped:
+            self._unwatch_exit(p)
+            # Dispatch almayan process önce standby'a döner; pool doluysa kapatılır
+            if len(self._standby) < self.standby_size:
+                self._standby.append(p)
+            else:
+                to_terminate.append(p)
+        if to_terminate:
+            self._terminate_processes(to_terminate)
+
+    def _watch_exit(self, proc_dict):
+        """
+        Process sentinel'ini watch loop'a kaydet: process ölünce _on_process_exit çağrılır.
+        Process başına periyodik is_alive() (waitpid) yoklaması yerine tek bir fd event'i.
+        Sadece watch loop thread'inden (veya loop başlamadan önce) çağrılır.
+        """
+        # Windows event loop'ları sentinel handle'larını izleyemez; ölü process _take_standby'da elenir
+        if self._watch_loop is None or os.name == "nt":
             return
+        self._watch_loop.add_reader(proc_dict['process'].process.sentinel, self._on_process_exit, proc_dict)
 
-        command_data = {
-            "command": "start_thread",
-            "data": "miniflow.parallelism_engine.process.modules.python_runner.python_runner",
-            "args": (item,),
-            "kwargs": {}
-        }
-        process.get("cmd_pipe").send(command_data)
+    def _unwatch_exit(self, proc_dict):
+        if self._watch_loop is None or os.name == "nt":
+            return
+        self._watch_loop.remove_reader(proc_dict['process'].process.sentinel)
+
+    def _on_process_exit(self, proc_dict):
+        """Aktif process beklenmedik şekilde sonlandı: havuzdan çıkar, gerekirse yerine yenisini başlat"""
+        self._unwatch_exit(proc_dict)
+        if self.shutdown_event.is_set():
+            return
+
+        process = proc_dict['process'].process
+        with self.process_lock:
+            if proc_dict not in self.active_processes:
+                return
+            index = self.active_processes.index(proc_dict)
+            del self.active_processes[index]
+            del self._pids[index]
+            del self._thread_counters[index]
+            self._publish_snapshot()
+        with self._load_lock:
+            self._process_by_pid.pop(process.pid, None)
+            self.thread_count_by_pid.pop(process.pid, None)
+            self._rebuild_load_heap_locked()
+
+        process.join(timeout=1.0)  # Sentinel kapandı; process zaten sonlanmış, sadece reap edilir
+        logger.warning("[QueueWatcher] Process %s exited unexpectedly (exitcode %s)", process.pid, process.exitcode)
+
+        missing = self.min_process_count - len(self.active_processes)
+        if missing > 0:
+            self._start_processes(missing)
+        if self._scale_signal is not None:
+            self._scale_signal.set()
+
+    def _terminate_process(self, proc_dict):
+        self._terminate_processes([proc_dict])
+
+    def _terminate_processes(self, proc_dicts, timeout=5.0):
+        """Önce tüm process'lere shutdown gönder ve sonlandır, sonra hepsini tek deadline ile bekle"""
+        # Phase 1: Broadcast (join yok)
+        for proc_dict in proc_dicts:
+            try:
+                proc_dict['cmd_pipe'].send_bytes(SHUTDOWN_COMMAND)
+                if proc_dict['process'].process.is_alive():
+                    proc_dict['process'].process.terminate()
+            except Exception as e:
+                logger.error("Error shutting down process: %s", e)
+
+        # Phase 2: Join - toplam süre process sayısından bağımsız olarak en fazla timeout
+        deadline = time.monotonic() + timeout
+        for proc_dict in proc_dicts:
+            proc_dict['process'].process.join(timeout=max(0.0, deadline - time.monotonic()))
+
+    def _dispatch_items(self, items: list):
+        """
+        Item'ları process'lere dağıt; her process'e tek pickle + tek send_bytes.
+        Geri kuyruğa alınan item sayısını döndürür.
+        """
+        # 1. Process seçimi: batch için tek _load_lock (process_lock alınmaz; durdurulan process'ler
+        #    _process_by_pid'den çıkarıldığı için heap'te stale olarak atlanır)
+        batches = []
+        with self._load_lock:
+            # Item listesi process başına ardışık dilimlere bölünür (item başına seçim yok)
+            start = 0
+            for process, taken in self._assign_locked(len(items)):
+                batches.append((process, items[start:start + taken]))
+                start += taken
+            requeue = items[start:]
+            avg_load = sum(self.thread_count_by_pid.values()) / max(1, len(self.thread_count_by_pid))
+
+        # Yük eşiği aşıldıysa scaler'ı hemen uyandır (dispatch ile aynı event loop'ta çalışır)
+        if (requeue or avg_load > self.scale_up_threshold) and self._scale_signal is not None:
+            self._scale_signal.set()
+
+        # 2. Gönderim lock dışında: 1 byte opcode + process'in item listesi (item başına args tuple'ı yok)
+        for process, batch in batches:
+            command_bytes = RUN_PYTHON_BATCH + pickle.dumps(batch, protocol=pickle.HIGHEST_PROTOCOL)
+            try:
+                process['cmd_pipe'].send_bytes(command_bytes)
+            except Exception as e:
+                # Process bu arada durdurulmuş olabilir; item'lar kaybolmasın
+                logger.warning("Error dispatching batch: %s", e)
+                requeue.extend(batch)
+
+        for item in requeue:
+            self._requeue_item(item)
+        return len(requeue)
+
+    def _requeue_item(self, item: json):
+        # Uygun process yok: geri kuyruğa al. Kuyruk doluysa item sessizce kaybolmasın,
+        # failed sonucu olarak output'a gönderilsin (execution takılı kalmaz)
+        if not self.input_queue.put(item):
+            item["error_message"] = "No active processes available and input queue is full"
+            item["status"] = "failed"
+            self.output_queue.put(item)
 
-    def _auto_scale_processes(self):
-        while not self.shutdown_event.is_set():
+    async def _auto_scale_processes(self):
+        psutil.cpu_percent(interval=None)  # Referans ölçüm; sonraki çağrı son çağrıdan bu yana ölçer
+        while True:
             try:
-                cpu_usage = psutil.cpu_percent(interval=1)
-                self.thread_count_list = self._get_process_thread_counts()
-                avg_threads = sum(t for t in self.thread_count_list if t is not None) / max(1, len(self.thread_count_list))
-                print(self.thread_count_list)
-                if len(self.active_processes) < self.max_cpu_count and avg_threads > 1.5:
-                    print("[Parallelism Engine] Scaling up processes")
+                # Dispatch sinyali gelene kadar bekle; gelmezse scale_idle_interval'da bir periyodik kontrol
+                try:
+                    await asyncio.wait_for(self._scale_signal.wait(), timeout=self.scale_idle_interval)
+                    signalled = True
+                except asyncio.TimeoutError:
+                    signalled = False
+                self._scale_signal.clear()
+
+                # Üst sınırdayken sinyal scale-up'a dönüşemez: metrik toplamadan bekle
+                if signalled and len(self.active_processes) >= self.max_cpu_count:
+                    continue
+
+                # CPU ölçümü ve reconcile sadece scale-down'ın değerlendirildiği periyodik kontrolde yapılır
+                cpu_usage = None
+                if not signalled:
+                    cpu_usage = psutil.cpu_percent(interval=None)
+                    # Sessiz dönemde heap'i gerçek sayılarla eşitle (burst sırasında iyimser sayılar korunur)
+                    self._reconcile_thread_counts()
+                    self.thread_count_list = self._get_process_thread_counts()
+                    logger.debug("[Parallelism Engine] Thread counts: %s", self.thread_count_list)
+
+                # Karar dispatch'in gördüğü yükle verilir (henüz başlamamış thread'ler dahil)
+                with self._load_lock:
+                    loads = list(self.thread_count_by_pid.values())
+                avg_threads = sum(loads) / max(1, len(loads))
+                scaled = False
+                if len(self.active_processes) < self.max_cpu_count and avg_threads > self.scale_up_threshold:
+                    logger.info("[Parallelism Engine] Scaling up processes")
                     self._start_processes(1)
+                    scaled = True
 
-                elif cpu_usage < 30 and len(self.active_processes) > self.min_process_count and avg_threads < 1:
-                    print("[Parallelism Engine] Scaling down processes")
+                elif cpu_usage is not None and cpu_usage < 30 and len(self.active_processes) > self.min_process_count and avg_threads < 1:
+                    logger.info("[Parallelism Engine] Scaling down processes")
                     self._stop_processes(1)
 
+                # Fork maliyeti scale-up anında değil, burada (kritik yol dışında) ödenir
+                self._refill_standby()
+
+                if scaled:
+                    await asyncio.sleep(self.scale_cooldown)
+
             except Exception as e:
-                print(f"Scaler error: {e}")
+                logger.error("Scaler error: %s", e)
+                await asyncio.sleep(self.scale_cooldown)
 
     def shutdown(self):
         """Graceful shutdown"""
         self.shutdown_event.set()
 
-        # Tüm process'lere shutdown komutu gönder
-        for p in self.active_processes:
+        # Watch loop'u durdur: coroutine'ler anında cancel edilir
+        if self._watch_loop is not None:
             try:
-                p['cmd_pipe'].send({"command": "shutdown"})
-                p['process'].shutdown()
-            except Exception as e:
-                print(f"Error shutting down process: {e}")
+                self._watch_loop.call_soon_threadsafe(self._watch_stop.set)
+            except RuntimeError:
+                pass  # Loop zaten kapanmış
 
-    def _start_watch_threads(self, input_func: callable):
-        input_thread = Thread(target=input_func, daemon=True)
-        input_thread.start()
+        # Tüm process'lere (standby dahil) shutdown komutu gönder
+        self._terminate_processes(self.active_processes + list(self._standby))
+        self._standby.clear()
 
-        self.scaler_thread = threading.Thread(target=self._auto_scale_processes, daemon=True)
-        self.scaler_thread.start()
+    def _get_ps_process(self, pid: int):
+        try:
+            return psutil.Process(pid)
+        except Exception as e:
+            logger.warning("[QueueWatcher] psutil process handle alınamadı: %s", e)
+            return None
 
-    def _set_process_priority(self, pid: int, priority):
-        """Setting process priority (with error handling)"""
+    def _set_process_priority(self, ps_process, priority):
+        """Setting process priority (with error handling); priority zaten aynıysa nice() çağrılmaz"""
         try:
-            ps_process = psutil.Process(pid)
-            ps_process.nice(priority)
+            if ps_process.nice() != priority:
+                ps_process.nice(priority)
             return True
         except (psutil.AccessDenied, PermissionError) as e:
-            print(f"[QueueWatcher] Priority ayarlanamadı (normal): {e}")
+            logger.debug("[QueueWatcher] Priority ayarlanamadı (normal): %s", e)
             return False
         except Exception as e:
-            print(f"[QueueWatcher] Priority ayarlama hatası: {e}")
+            logger.warning("[QueueWatcher] Priority ayarlama hatası: %s", e)
+            return False
+
+    def _pin_process(self, pid: int, ps_process):
+        """Worker'ı tek bir çekirdeğe sabitle; çekirdekler arası göçte L1/L2 cache'i kaybetmesin"""
+        core = self._cores[self._next_core % len(self._cores)]
+        self._next_core += 1
+        try:
+            if hasattr(os, "sched_setaffinity"):
+                os.sched_setaffinity(pid, {core})
+            elif ps_process is not None:
+                ps_process.cpu_affinity([core])
+            return True
+        except (AttributeError, OSError, psutil.AccessDenied) as e:
+            # macOS affinity desteklemez; kısıtlı ortamlarda izin olmayabilir
+            logger.debug("[QueueWatcher] CPU affinity ayarlanamadı: %s", e)
             return False
 
     def _nt_process_classes(self):
@@ -32,18 +32,16 @@ class Manager:
     def put_items_bulk(self, items: list):
         """
         Amaç: Birden fazla item'ı bulk olarak ekler (batch processing için)
-        Döner: Başarı durumu (True/False)
-        
-        Performance optimized version with retry mechanism
+        Döner: Kabul edilen item sayısı; kuyruk dolarsa baştaki item'lar kabul edilir,
+        kalanlar çağıranda kalır (bekleme/retry yok)
         """
         if not self.started:
             self.start()
         
         if not items:
-            return True
+            return 0
         
-        # Use optimized batch put method
-        return self.input_queue.put_batch(items)
+        return self.input_queue.put_many(items)
 
     def shutdown(self):
         """Graceful shutdown"""
@@ -1,83 +1,172 @@
-from multiprocessing import Process, Pipe
-from .base_thread import BaseThread
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Process, Pipe, RawValue
 from ..queue_module import BaseQueue
+import ctypes
+import functools
 import threading
-import time
 import importlib
+import io
+import os
+import pickle
+
+# Health pipe opcode'ları (1 byte, pickle yok)
+SHUTDOWN = b"\x02"
+
+# Cmd pipe shutdown komutu bir kez pickle'lanır (_decode_command dict başlığı olarak okur)
+SHUTDOWN_COMMAND = pickle.dumps({"command": "shutdown"}, protocol=pickle.HIGHEST_PROTOCOL)
+
+# Cmd pipe hot path opcode'ları: ilk byte hedef fonksiyonu seçer, kalanı pickle'lanmış item listesi
+# (her item hedefe tek pozisyonel argüman olarak verilir).
+# Pickle (protokol 2+) akışları 0x80 ile başladığı için eski komut formatıyla çakışmaz.
+RUN_PYTHON_BATCH = b"\x10"
+PYTHON_RUNNER_PATH = "miniflow.parallelism_engine.process.modules.python_runner.python_runner"
+OPCODE_TARGETS = {
+    RUN_PYTHON_BATCH: PYTHON_RUNNER_PATH,
+}
+
+# Process başına worker thread sayısı; QueueWatcher bir process'e bundan fazla eşzamanlı iş atamaz
+MAX_WORKER_THREADS = 10
 
 
 class BaseProcess:
-    def __init__(self, cmd_pipe, health_pipe, output_queue: BaseQueue):
+    def __init__(self, cmd_pipe, health_pipe, output_queue: BaseQueue, thread_count_queue=None, parent_conns=()):
         """
         pipe: Bu process'e özel child_conn
         output_queue: Sonuçları QueueWatcher'a göndermek için paylaşılan kuyruk
+        thread_count_queue: Thread sayısı değiştikçe (pid, thread_count) gönderilen paylaşılan kuyruk
+        parent_conns: Parent'ta kalan gönderme uçları; child başlar başlamaz kendi kopyalarını kapatır
+        thread_count: Paylaşılan bellekteki güncel thread sayısı (tek yazan: bu process, okuyan: QueueWatcher)
         """
         self.cmd_pipe = cmd_pipe
         self.health_pipe = health_pipe
         self.output_queue = output_queue
+        self.thread_count_queue = thread_count_queue
+        self.thread_count = RawValue(ctypes.c_int32, 0)
         # Lock'ları process içinde oluşturacağız - pickle issue
-        self.process = Process(target=self.run_process, args=(self.cmd_pipe, self.health_pipe, self.output_queue))
-
-    def _cleanup_dead_threads(self):
-        """Bitmiş thread'leri listeden çıkar"""
-        if hasattr(self, 'threads'):
-            self.threads = [t for t in self.threads if t.thread.is_alive()]
+        self.process = Process(target=self.run_process,
+                               args=(self.cmd_pipe, self.health_pipe, self.output_queue, tuple(parent_conns)))
+
+    def _on_task_done(self, future):
+        """Pool callback'i: iş sayısını düşür. Kuyruk bildirimi health_check tick'inde toplu yapılır"""
+        with self.lock:
+            self.in_flight -= 1
+            self.thread_count.value = self.in_flight
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.output_queue.put({"error": f"Task error: {error}"})
+
+    def _report_thread_count(self, force=False):
+        """Thread sayısı değiştiyse QueueWatcher'a bildir (push tabanlı, polling yok)"""
+        thread_count = self.in_flight
+        self.thread_count.value = thread_count
+        if self.thread_count_queue is None:
+            return
+        if force or thread_count != self._reported_thread_count:
+            self._reported_thread_count = thread_count
+            try:
+                self.thread_count_queue.put_nowait((os.getpid(), thread_count))
+            except Exception:
+                pass
 
     def start(self):
         self.process.start()
 
-    def run_process(self, cmd_pipe, health_pipe, output_queue):
+    def run_process(self, cmd_pipe, health_pipe, output_queue, parent_conns=()):
         """
         Bu method, process içinde çalışacak.
         pipe: Bu process'e özel child_conn
         output_queue: Sonuçları QueueWatcher'a göndermek için paylaşılan kuyruk
+        parent_conns: Fork ile miras kalan parent gönderme uçları (hemen kapatılır)
         """
-        # Process içinde lock ve thread listesi oluştur
-        self.threads = []
+        # Fork, parent'ın gönderme uçlarını da child'a kopyalar. Kapatılmazsa parent ölünce
+        # pipe'ın yazan ucu child'da açık kalır ve recv hiçbir zaman EOFError vermez.
+        for conn in parent_conns:
+            conn.close()
+
+        # Process içinde lock ve worker thread pool'u oluştur (thread'ler iş başına değil bir kez açılır)
+        self.pool = ThreadPoolExecutor(max_workers=MAX_WORKER_THREADS, thread_name_prefix="miniflow-worker")
+        self.in_flight = 0  # Pool'a verilmiş ve henüz bitmemiş iş sayısı (QueueWatcher'a thread sayısı olarak raporlanır)
         self.lock = threading.Lock()
         self.shutdown_event = threading.Event()
+        self._reported_thread_count = None
+        self._report_thread_count(force=True)
 
         def health_check():
             while not self.shutdown_event.is_set():
                 try:
-                    self._cleanup_dead_threads()
-                    if health_pipe.poll():
-                        health_data = health_pipe.recv()
-
-                        if health_data["command"] == "shutdown":
+                    # Biten işler 0.1s'lik tick'lerde toplu bildirilir (iş başına kuyruk put'u yok)
+                    with self.lock:
+                        self._report_thread_count()
+                    # poll(timeout) select ile bekler: mesaj gelince hemen uyanır
+                    if health_pipe.poll(0.1):
+                        opcode = health_pipe.recv_bytes()[:1]
+
+                        if opcode == SHUTDOWN:
                             self.shutdown_event.set()
                             break
 
-                        elif health_data["command"] == "get_thread_count":
-                            health_pipe.send({"thread_count": len(self.threads)})
-
+                except (EOFError, OSError):
+                    # Parent pipe'ı kapattı (QueueWatcher sonlandı): process'i kapat
+                    self.shutdown_event.set()
+                    break
                 except Exception as e:
                     output_queue.put({"error": f"Thread controller error: {e}"})
-
-                time.sleep(0.1)
+                    # Shutdown gelirse bekleme anında biter
+                    self.shutdown_event.wait(0.1)
         
+        # Opcode -> hedef fonksiyon tablosu process başında bir kez çözülür
+        targets = {opcode: self.import_from_path(path) for opcode, path in OPCODE_TARGETS.items()}
+
         def thread_controller():
             while not self.shutdown_event.is_set():
                 try:
-                    if cmd_pipe.poll():
-                        command_data = cmd_pipe.recv()
-
-                        if command_data["command"] == "start_thread":
-                            dotted_path = command_data["data"]
-                            target_func = self.import_from_path(dotted_path)
-                            args = command_data.get("args", ())
-                            kwargs = command_data.get("kwargs", {})
-
-                            self.start_thread(target_func, args, kwargs)
-                            
-                        elif command_data["command"] == "shutdown":
-                            self.shutdown_event.set()
-                            break
-                            
+                    # Komut gelene kadar recv'de bloklan (timeout'lu poll yok -> boşta CPU ve gecikme yok).
+                    # Shutdown bu thread'i uyandırmak zorunda değil: main thread shutdown_event ile çıkar,
+                    # daemon thread process ile birlikte sonlanır.
+                    data = cmd_pipe.recv_bytes()
+
+                    # Hot path: opcode + item listesi (başlık decode'u, string karşılaştırma ve import yok)
+                    target_func = targets.get(data[:1])
+                    if target_func is not None:
+                        for item in pickle.loads(memoryview(data)[1:]):
+                            self.start_thread(target_func, (item,), {}, report=False)
+                        # Batch başına tek thread sayısı bildirimi
+                        with self.lock:
+                            self._report_thread_count()
+                        continue
+
+                    command_data = self._decode_command(data)
+
+                    if command_data["command"] == "start_thread":
+                        dotted_path = command_data["data"]
+                        target_func = self.import_from_path(dotted_path)
+                        args = command_data.get("args", ())
+                        kwargs = command_data.get("kwargs", {})
+
+                        self.start_thread(target_func, args, kwargs)
+
+                    elif command_data["command"] == "start_thread_batch":
+                        target_func = self.import_from_path(command_data["data"])
+                        for args in command_data["items"]:
+                            self.start_thread(target_func, args, {}, report=False)
+                        # Batch başına tek thread sayısı bildirimi
+                        with self.lock:
+                            self._report_thread_count()
+                        
+                    elif command_data["command"] == "shutdown":
+                        self.shutdown_event.set()
+                        break
+
+                except (EOFError, OSError):
+                    # Parent pipe'ı kapattı (QueueWatcher sonlandı): process'i kapat
+                    self.shutdown_event.set()
+                    break
                 except Exception as e:
                     output_queue.put({"error": f"Thread controller error: {e}"})
-
-                time.sleep(0.1)
+                    # Shutdown gelirse bekleme anında biter
+                    self.shutdown_event.wait(0.1)
 
         controller = threading.Thread(target=thread_controller, daemon=True)
         controller.start()
@@ -86,22 +175,39 @@ class BaseProcess:
         comm.start()
 
         # Graceful shutdown için controller thread'ini bekle
-        while not self.shutdown_event.is_set():
-            time.sleep(1)
+        self.shutdown_event.wait()
+        # Sırada bekleyen işler iptal edilir; çalışanlar process çıkışında beklenir
+        self.pool.shutdown(wait=False, cancel_futures=True)
 
-    def start_thread(self, target, args, kwargs):
+    @staticmethod
+    def _decode_command(data):
         """
-        Yeni thread başlat ve yönet.
+        Opcode'suz komutu çöz. Üç format desteklenir:
+        - dict (send ile gönderilen komutlar, örn. shutdown)
+        - ("start_thread", dotted_path) başlığı + ardından pickle'lanmış args
+        - ("start_thread_batch", dotted_path) başlığı + ardından pickle'lanmış args listesi
         """
-        thread = BaseThread(target=target, args=args, output_queue=self.output_queue)
-        thread.start()
-        
-        if hasattr(self, 'lock'):
-            with self.lock:
-                self.threads.append(thread)
-                # Periyodik temizlik
-                if len(self.threads) > 3:  # Threshold
-                    self._cleanup_dead_threads()
+        buffer = io.BytesIO(data)
+        header = pickle.load(buffer)
+        if isinstance(header, dict):
+            return header
+
+        command, dotted_path = header
+        if command == "start_thread_batch":
+            return {"command": command, "data": dotted_path, "items": pickle.load(buffer)}
+        return {"command": command, "data": dotted_path, "args": pickle.load(buffer), "kwargs": {}}
+
+    def start_thread(self, target, args, kwargs, report=True):
+        """
+        İşi process'in thread pool'una gönder; target'a son argüman olarak output_queue verilir.
+        report=False: thread sayısı bildirimi çağırana bırakılır (batch başlatma)
+        """
+        with self.lock:
+            self.in_flight += 1
+            if report:
+                self._report_thread_count()
+        future = self.pool.submit(target, *args, self.output_queue, **kwargs)
+        future.add_done_callback(self._on_task_done)
 
     def shutdown(self):
         """Graceful shutdown"""
@@ -111,9 +217,13 @@ class BaseProcess:
             self.process.terminate()
             self.process.join(timeout=5)
 
-    def import_from_path(self, dotted_path):
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def import_from_path(dotted_path):
         """
         Örnek: "process.modules.bash_runner.bash_runner"
+
+        Sonuç dotted_path başına cache'lenir; opcode'suz komutlarda her batch'te import çözülmez.
         """
         module_path, func_name = dotted_path.rsplit(".", 1)
         module = importlib.import_module(module_path)
@@ -1,13 +1,33 @@
 import importlib.util
 import json
+import os
+import threading
 from queue import Queue
 
+# orjson varsa script çıktıları onunla parse edilir (kurulu değilse standart json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-def python_runner(item: json, output_queue: Queue):
-    try:
-        script_path = item.get("script_path")
-        if not script_path:
-            raise ValueError("script_path is missing")
+# script_path -> (mtime, module): aynı script her task'te yeniden derlenip çalıştırılmaz,
+# dosya değişince (mtime) yeniden yüklenir
+_module_cache = {}
+_module_cache_lock = threading.Lock()
+
+
+def _load_module(script_path: str):
+    mtime = os.stat(script_path).st_mtime_ns
+    cached = _module_cache.get(script_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with _module_cache_lock:
+        # Aynı anda bekleyen başka thread yüklemiş olabilir
+        cached = _module_cache.get(script_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
 
         module_name = script_path.split("/")[-1].replace(".py", "")
 
@@ -18,25 +38,32 @@ def python_runner(item: json, output_queue: Queue):
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
 
+        # Sözleşme yüklemede bir kez doğrulanır; cache'ten gelen modülde tekrar kontrol edilmez
         if not hasattr(module, "module"):
             raise AttributeError("The module must contain a 'module()' function")
 
-        run_module = module.module()
+        _module_cache[script_path] = (mtime, module)
+        return module
 
-        if not hasattr(run_module, "run"):
+
+def python_runner(item: json, output_queue: Queue):
+    try:
+        script_path = item.get("script_path")
+        if not script_path:
+            raise ValueError("script_path is missing")
+
+        # run metodu tek getattr ile alınır (hasattr + attribute erişimi yerine)
+        run = getattr(_load_module(script_path).module(), "run", None)
+        if run is None:
             raise AttributeError("The object returned by 'module()' must have a 'run()' method")
 
         context = item.get("context")
-
         if isinstance(context, str):
-            context = json.loads(context)
-
-
-
-        result = run_module.run(context)
+            context = _json_loads(context)
 
-        parsed_output = json.loads(result)
-        item["result_data"] = parsed_output
+        # run() dict döndürebilir (JSON round-trip yok); string dönerse JSON olarak parse edilir
+        result = run(context)
+        item["result_data"] = result if isinstance(result, dict) else _json_loads(result)
         item["status"] = "success"
 
     except FileNotFoundError:
@@ -1,13 +1,59 @@
+import asyncio
 import multiprocessing
 import json
+import logging
+import os
 import queue
 import time
+from multiprocessing.reduction import ForkingPickler
+
+logger = logging.getLogger(__name__)
+
+# Kuyruk dolu uyarısı en fazla bu aralıkla loglanır (dolu kuyrukta her put'ta stdout'a yazmamak için)
+FULL_WARNING_INTERVAL = 10.0
+
+
+async def wait_readable(conn):
+    """Connection/pipe okunabilir olana kadar event loop'u bloklamadan bekle"""
+    loop = asyncio.get_running_loop()
+    ready = loop.create_future()
+    fd = conn.fileno()
+    loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+    try:
+        await ready
+    finally:
+        loop.remove_reader(fd)
+
+
+async def async_queue_get(mp_queue):
+    """
+    multiprocessing.Queue'dan asenkron get - item gelene kadar coroutine askıda kalır
+
+    Unix'te queue'nun okuma pipe'ı event loop'a kaydedilir (timeout/polling yok).
+    Windows event loop'ları pipe izleyemediği için kısa timeout'lu get bir worker
+    thread'de çalıştırılır.
+    """
+    while True:
+        try:
+            return mp_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        if os.name == "nt":
+            try:
+                return await asyncio.to_thread(mp_queue.get, True, 0.1)
+            except queue.Empty:
+                continue
+
+        # Okunabilir olması item'ın bize kalacağını garanti etmez (başka consumer) -> tekrar dene
+        await wait_readable(mp_queue._reader)
 
 
 class BaseQueue:
     def __init__(self, maxsize=1000):  # Increased from 100 to 1000
         self.q = multiprocessing.Queue(maxsize=maxsize)
         self.dropped_items = 0  # Track dropped items for monitoring
+        self._last_full_warning = 0.0
 
     def put(self, item: json):
         """Enhanced put with better error handling"""
@@ -16,11 +62,14 @@ class BaseQueue:
             return True
         except queue.Full:
             self.dropped_items += 1
-            print(f"[BaseQueue] WARNING: Queue full, item dropped (total dropped: {self.dropped_items})")
+            now = time.monotonic()
+            if now - self._last_full_warning > FULL_WARNING_INTERVAL:
+                self._last_full_warning = now
+                logger.warning("[BaseQueue] Queue full, item dropped (total dropped: %s)", self.dropped_items)
             return False
         except Exception as e:
             self.dropped_items += 1
-            print(f"[BaseQueue] ERROR: Put failed: {e}")
+            logger.error("[BaseQueue] Put failed: %s", e)
             return False
     
     def put_with_retry(self, item: json, max_retries=3, retry_delay=0.1):
@@ -38,7 +87,7 @@ class BaseQueue:
             return True
         except:
             self.dropped_items += 1
-            print("[BaseQueue] CRITICAL: Queue full after 3 retries, item dropped")
+            logger.critical("[BaseQueue] Queue full after %s retries, item dropped", max_retries)
             return False
     
     def put_batch(self, items: list):
@@ -53,10 +102,33 @@ class BaseQueue:
         
         success_rate = successful / len(items)
         if success_rate < 0.8:  # Less than 80% success
-            print(f"[BaseQueue] WARNING: Batch put low success rate: {success_rate:.1%}")
+            logger.warning("[BaseQueue] Batch put low success rate: %.1f%%", success_rate * 100)
         
         return success_rate > 0.5  # Return True if more than 50% successful
 
+    def put_many(self, items: list):
+        """
+        Item'ları sırayla ekle; kuyruk dolunca dur (kalanlar denenmez, bekleme/retry yok).
+        Kabul edilen item sayısını döndürür; kabul edilmeyenler çağıranda kalır (drop edilmez).
+        """
+        accepted = 0
+        for item in items:
+            try:
+                self.q.put_nowait(item)
+            except queue.Full:
+                break
+            except Exception as e:
+                logger.error("[BaseQueue] Put many failed: %s", e)
+                break
+            accepted += 1
+
+        if accepted < len(items):
+            now = time.monotonic()
+            if now - self._last_full_warning > FULL_WARNING_INTERVAL:
+                self._last_full_warning = now
+                logger.warning("[BaseQueue] Queue full, accepted %s of %s items", accepted, len(items))
+        return accepted
+
     def get_with_timeout(self, timeout=1.0):
         """Get with timeout - safer version"""
         try:
@@ -64,9 +136,40 @@ class BaseQueue:
         except queue.Empty:
             return None
         except Exception as e:
-            print(f"[BaseQueue] ERROR: Get with timeout failed: {e}")
+            logger.error("[BaseQueue] Get with timeout failed: %s", e)
             return None
 
+    def get_many(self, max_items, timeout=0.0):
+        """
+        Kuyrukta hazır olan en fazla max_items item'ı tek okuma lock'u alımıyla çek.
+        İlk item için en fazla timeout kadar beklenir; item yoksa boş liste döner.
+        Unpickle işlemi lock bırakıldıktan sonra yapılır (diğer consumer'ları bekletmez).
+        """
+        q = self.q
+        raw_items = []
+        try:
+            deadline = time.monotonic() + timeout
+            if not q._rlock.acquire(True, timeout):
+                return []
+            try:
+                if not q._poll(max(0.0, deadline - time.monotonic())):
+                    return []
+                while len(raw_items) < max_items:
+                    raw_items.append(q._reader.recv_bytes())
+                    q._sem.release()
+                    if not q._poll():
+                        break
+            finally:
+                q._rlock.release()
+            return [ForkingPickler.loads(raw) for raw in raw_items]
+        except Exception as e:
+            logger.error("[BaseQueue] Get many failed: %s", e)
+            return [ForkingPickler.loads(raw) for raw in raw_items]
+
+    async def get_async(self):
+        """Item gelene kadar bekleyen asenkron get (timeout yok, cancel ile sonlanır)"""
+        return await async_queue_get(self.q)
+
     def get(self):
         """Legacy get method - kept for compatibility"""
         try:
@@ -75,7 +178,7 @@ class BaseQueue:
         except queue.Empty:
             return None
         except Exception as e:
-            print(f"[BaseQueue] Get error: {e}")
+            logger.error("[BaseQueue] Get error: %s", e)
             return None
 
     def get_without_task(self):
@@ -4,20 +4,16 @@ import threading
 import logging
 import time
 
-# Utility
-from miniflow.utils import setup_logging
-
 # Miniflow Database Module
 from miniflow.database_manager import DatabaseEngine
 from miniflow.database_manager import DatabaseOrchestration
 
-setup_logging()
 logger = logging.getLogger(__name__)
-logger.debug(f"{__name__} Logger tanımları tanımlandı")
 
 class MiniflowInputMonitor:
     def __init__(self, database_engine: DatabaseEngine, database_orchestration: DatabaseOrchestration, execution_engine,
-                 polling_interval=0.1, batch_size=50, worker_threads=4):
+                 polling_interval=0.1, batch_size=50, worker_threads=4, wakeup_event=None,
+                 min_interval=0.005, max_interval=None, busy_budget=8):
        
         # Database Manager Değişkenleri -> MiniflowCore tarafında kullanılacak ve iletilecek 
         self.database_engine = database_engine
@@ -34,6 +30,21 @@ class MiniflowInputMonitor:
         self.main_thread = None                                                                     # Ana thread 
         self.worker_pool = None                                                                     # Worker pool 
         self.shutdown_event = threading.Event()                                                     # Shutdown event
+        self.wakeup_event = wakeup_event or threading.Event()                                       # Yeni görev bildirimi -> polling_interval sadece üst sınır
+
+        # Adaptive polling parametreleri (NAPI tarzı)
+        self.min_interval = min_interval                                                            # Yoğun yükte bekleme süresi
+        self.max_interval = max_interval if max_interval is not None else polling_interval          # Boşta en fazla bekleme süresi
+        self.busy_budget = busy_budget                                                              # Dolu batch'ler için art arda hızlı tur sayısı
+        self.current_interval = self.min_interval
+        self.busy_cycles = 0
+
+        # Hazır görev sayacı -> health check her seferinde COUNT sorgusu atmasın
+        self._ready_count = 0
+
+    def ready_count(self):
+        """Son döngüde gözlenen hazır görev sayısı (start'ta COUNT ile doldurulur)"""
+        return self._ready_count
 
     def is_running(self):
         return self.running and self.main_thread and self.main_thread.is_alive() 
@@ -43,6 +54,13 @@ class MiniflowInputMonitor:
             logger.warning("Input monitor zaten çalışıyor")
             return
         
+        # Hazır görev sayacını başlangıçta tek bir COUNT sorgusu ile doldur
+        try:
+            with self.database_engine.get_session_context() as session:
+                self._ready_count = self.database_orchestration.execution_input_crud.count_ready_tasks(session)
+        except Exception as e:
+            logger.warning(f"Hazır görev sayısı alınamadı: {e}")
+
         self.running = True                                                                         # Çalışma durumunu True yap
         self.shutdown_event.clear()                                                                 # Shutdown event'i temizle -> ???
 
@@ -72,6 +90,7 @@ class MiniflowInputMonitor:
         
         self.running = False                                                                         # Çalışma durumunu False yap
         self.shutdown_event.set()                                                                    # Shutdown event'i set et 
+        self.wakeup_event.set()                                                                      # Bekleyen döngüyü hemen uyandır
 
         # Shutdown thread pool
         if self.worker_pool:
@@ -97,6 +116,9 @@ class MiniflowInputMonitor:
 
         while self.running and not self.shutdown_event.is_set():                                    
             try:
+                # Sorgudan önce temizle -> sorgu sırasında gelen bildirim kaybolmaz
+                self.wakeup_event.clear()
+
                 # ------------------------------------------------------------
                 # 1. Görevleri kontrol eder ve hazır olanları işleme alır 
                 # Hazır görevler -> dependency_count = 0 olan görevler -> priority'ye göre sıralanır
@@ -108,12 +130,27 @@ class MiniflowInputMonitor:
                 # ------------------------------------------------------------
                 # 2. Görevleri işleme alır ve Execution Engine'e gönderir
                 # ------------------------------------------------------------
+                fetched_count = len(ready_tasks) if ready_tasks else 0
+                removed_count = 0
                 if ready_tasks:
                     logger.debug(f"{len(ready_tasks)} hazır görev bulundu")
-                    self.__send_tasks(ready_tasks)
-                
-                # Eğer görevleri çektiysen, polling interval'e göre bekle
-                time.sleep(self.polling_interval)
+                    removed_count = self.__send_tasks(ready_tasks)
+
+                # Sayaç güncelle: batch dolu değilse tablodaki tüm hazır görevler görülmüştür (kesin değer),
+                # doluysa kalan sayı bilinmez -> alt sınır olarak tut
+                remaining = fetched_count - removed_count
+                if fetched_count < self.batch_size:
+                    self._ready_count = remaining
+                else:
+                    self._ready_count = max(self._ready_count - removed_count, remaining)
+
+                # ------------------------------------------------------------
+                # 3. Bekleme süresini ayarla ve bildirim / timeout bekle
+                # ------------------------------------------------------------
+                self.__adjust_polling_interval(fetched_count)
+                if self.wakeup_event.wait(timeout=self.current_interval):
+                    # Yeni görev bildirimi geldi -> bir sonraki turda hızlı başla
+                    self.current_interval = self.min_interval
                 
             except Exception as e:
                 logger.error(f"Input monitor döngü hatası: {e}")
@@ -121,6 +158,16 @@ class MiniflowInputMonitor:
         
         logger.debug("Input monitor döngüsü sonlandırıldı")
 
+    def __adjust_polling_interval(self, fetched_count):
+        # Batch doluysa (daha fazla iş var) budget bitene kadar polling modunda kal
+        if fetched_count >= self.batch_size and self.busy_cycles < self.busy_budget:
+            self.busy_cycles += 1
+            self.current_interval = self.min_interval
+        else:
+            # Boşta veya budget bitti -> exponential backoff (max_interval ile sınırlı)
+            self.busy_cycles = 0
+            self.current_interval = min(self.current_interval * 2, self.max_interval)
+
     def __send_tasks(self, tasks):
         # Check if manager is available
         if not self.execution_engine:
@@ -168,17 +215,22 @@ class MiniflowInputMonitor:
             # 3.1 Görevleri Execution Engine'a bulk olrak gönder
             # ------------------------------------------------------------
             logger.info(f"{len(prepared_payloads)} task parallelism engine'e gönderiliyor")
-            success = self.execution_engine.put_items_bulk(prepared_payloads)                                # Hazır işlemleri motor'a gönder
-            logger.debug(f"Bulk gönderim sonucu: {success}")
+            accepted = self.execution_engine.put_items_bulk(prepared_payloads)                               # Hazır işlemleri motor'a gönder
+            logger.debug(f"Bulk gönderim sonucu: {accepted}/{len(prepared_payloads)}")
             
-            if success:
+            if accepted:
                 # ------------------------------------------------------------
-                # 3.2 Göreve gönderilen görevleri tablodan sil
+                # 3.2 Sadece kabul edilen görevleri tablodan sil
+                # Kuyruk dolduysa kalanlar tabloda kalır ve sonraki turda tekrar gönderilir
                 # ------------------------------------------------------------
+                if accepted < len(prepared_payloads):
+                    logger.warning(f"Input kuyruğu dolu: {len(prepared_payloads) - accepted} görev sonraki tura bırakıldı")
                 with self.database_engine.get_session_context() as session:
-                    removed_count = self.database_orchestration.remove_completed_tasks(session, task_ids)
+                    removed_count = self.database_orchestration.remove_completed_tasks(session, task_ids[:accepted])
                     logger.debug(f"{removed_count} tasks removed from queue")
+                return removed_count
             else:
                 logger.error("Task'lar parallelism engine'e gönderilemedi")
         else:
-            logger.warning(f"{len(tasks)} task'dan hiç payload hazırlanamadı")
\ No newline at end of file
+            logger.warning(f"{len(tasks)} task'dan hiç payload hazırlanamadı")
+        return 0
\ No newline at end of file
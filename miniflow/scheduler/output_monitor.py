@@ -4,20 +4,15 @@ import threading
 import logging
 import time
 
-# Utility
-from miniflow.utils import setup_logging
-
 # Miniflow Database Module
 from miniflow.database_manager import DatabaseEngine
 from miniflow.database_manager import DatabaseOrchestration
 
-setup_logging()
 logger = logging.getLogger(__name__)
-logger.debug(f"{__name__} Logger tanımları tanımlandı")
 
 class MiniflowOutputMonitor:
     def __init__(self, database_engine: DatabaseEngine, database_orchestration: DatabaseOrchestration, execution_engine,
-                 polling_interval=0.5, batch_size=50, worker_threads=4):
+                 polling_interval=0.5, batch_size=50, worker_threads=4, input_wakeup_event=None):
        
         # Database Manager Değişkenleri -> MiniflowCore tarafında kullanılacak ve iletilecek 
         self.database_engine = database_engine
@@ -33,6 +28,7 @@ class MiniflowOutputMonitor:
         self.main_thread = None                                                                     # Ana thread 
         self.worker_pool = None                                                                     # Worker pool 
         self.shutdown_event = threading.Event()                                                     # Shutdown event
+        self.input_wakeup_event = input_wakeup_event                                                # Input monitor'ü yeni hazır görevler için uyandırır
 
         # Adaptive polling parametreleri
         self.min_polling_interval = 0.1
@@ -129,6 +125,11 @@ class MiniflowOutputMonitor:
                 # 2. Gelen çıktıları veri tabanına işle
                 # ------------------------------------------------------------
                 self.__process_results(results)
+
+                # Tamamlanan görevler bağımlı görevleri hazır hale getirmiş olabilir
+                if self.input_wakeup_event is not None:
+                    self.input_wakeup_event.set()
+
                 time.sleep(self.current_polling_interval)
             except Exception as e:  
                 logger.error(f"Output monitor döngü hatası: {e}")
@@ -1,10 +1,13 @@
 from .miniflow_logger import setup_logging
 from .utility_functions import create_script, delete_script, extract_dynamic_node_params, split_variable_reference
+from .utility_functions import encode_page_cursor, decode_page_cursor
 
 __all__ = [
     "setup_logging",
     "create_script",
     "delete_script",
     "extract_dynamic_node_params",
-    "split_variable_reference"
+    "split_variable_reference",
+    "encode_page_cursor",
+    "decode_page_cursor"
 ]
\ No newline at end of file
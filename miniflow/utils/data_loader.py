@@ -0,0 +1,59 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+
+class DataLoader:
+    """
+    Aynı event loop tick'inde gelen tekil load() çağrılarını tek bir batch fetch'te birleştirir
+
+    batch_fn key listesini alır ve {key: value} döndürür; sonuçta olmayan key'ler için
+    missing_error(key) ilgili çağırana fırlatılır. Cache tutulmaz, her batch taze okunur.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+                 missing_error: Callable[[Hashable], Exception], max_batch_size: int = 500):
+        self._batch_fn = batch_fn
+        self._missing_error = missing_error
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[Hashable, List[asyncio.Future]] = {}
+        self._scheduled_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def load(self, key: Hashable) -> Awaitable[Any]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+
+        # Bu tick içinde dispatch henüz planlanmadıysa planla
+        if self._scheduled_loop is None:
+            self._scheduled_loop = loop
+            loop.call_soon(self.__dispatch)
+        return future
+
+    def __dispatch(self):
+        pending, self._pending = self._pending, {}
+        loop, self._scheduled_loop = self._scheduled_loop, None
+
+        keys = list(pending)
+        for start in range(0, len(keys), self._max_batch_size):
+            chunk = {key: pending[key] for key in keys[start:start + self._max_batch_size]}
+            loop.create_task(self.__run_batch(chunk))
+
+    async def __run_batch(self, chunk: Dict[Hashable, List[asyncio.Future]]):
+        try:
+            results = await self._batch_fn(list(chunk))
+        except Exception as e:
+            # Tüm batch başarısız: her bekleyen çağırana aynı hata
+            for futures in chunk.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for key, futures in chunk.items():
+            for future in futures:
+                if future.done():
+                    continue
+                if key in results:
+                    future.set_result(results[key])
+                else:
+                    future.set_exception(self._missing_error(key))
@@ -1,17 +1,28 @@
+import base64
 import os
 import re
+from datetime import datetime
 
-def create_script(scripts_dir: str, script_name:str, script_extension: str, script_content: str):
+def create_script(scripts_dir: str, script_name:str, script_extension: str, script_content: str, sync: bool = False):
     # Script dosyasını script_name ile scripts klasörüne kaydet
     script_filename = f"{script_name}.{script_extension}"
     script_file_path = scripts_dir / script_filename
 
-    # File content'i dosyaya yaz
-    with open(script_file_path, 'w', encoding='utf-8') as target_file:
-        target_file.write(script_content)
+    # File content'i dosyaya yaz (buffer'sız tek write; sync=True ise diske kalıcı yaz)
+    data = script_content.encode('utf-8')
+    fd = os.open(script_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        if sync:
+            getattr(os, 'fdatasync', os.fsync)(fd)
+    finally:
+        os.close(fd)
 
-    # Absolute path'i hesapla
-    absolute_path = str(script_file_path.resolve())
+    # Absolute path'i hesapla (scripts_dir zaten absolute ise tekrar resolve etme)
+    absolute_path = str(script_file_path if script_file_path.is_absolute() else script_file_path.resolve())
 
     return absolute_path
 
@@ -45,4 +56,17 @@ def split_variable_reference(variable_reference):
         return variable_parts[0], variable_parts[1]
     
     raise ValueError(f"Invalid variable reference: {variable_reference}")
-    
+
+def encode_page_cursor(created_at: str, record_id: str) -> str:
+    # Keyset sayfalama cursor'ı: son satırın (created_at, id) değeri, URL-safe base64
+    raw = f"{created_at}|{record_id}".encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_page_cursor(cursor: str):
+    # encode_page_cursor çıktısını (created_at, id) çiftine çevirir; cursor değilse (eski tip düz ID) None döner
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, record_id = base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8').split('|', 1)
+        return datetime.fromisoformat(created_at), record_id
+    except ValueError:
+        return None